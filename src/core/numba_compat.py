@@ -0,0 +1,22 @@
+"""
+Optional Numba support for My Kingdom.
+Numba is not a required dependency. When it is missing, njit becomes a
+no-op decorator and prange falls back to range, so callers can check
+HAS_NUMBA to pick a NumPy implementation instead.
+
+Kernels are decorated with cache=True so the compiled machine code is
+written to __pycache__ and only the very first run pays the JIT cost.
+"""
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function unchanged."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
@@ -0,0 +1,13 @@
+"""
+Shared font cache for the UI screens.
+"""
+
+import functools
+
+import pygame
+
+
+@functools.lru_cache(maxsize=None)
+def get_font(size):
+    """Return the default font at the given size, opening the TTF only once per process."""
+    return pygame.font.Font(None, size)
@@ -12,6 +12,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from config.settings import *
 from src.core.logger import logger
+from src.ui.fonts import get_font
 from src.audio.music_manager import get_music_manager
 
 
@@ -57,9 +58,9 @@ class MainMenu:
 
         # Initialize fonts
         pygame.font.init()
-        self.title_font = pygame.font.Font(None, FONT_TITLE_SIZE)
-        self.button_font = pygame.font.Font(None, FONT_BUTTON_SIZE)
-        self.subtitle_font = pygame.font.Font(None, FONT_NORMAL_SIZE)
+        self.title_font = get_font(FONT_TITLE_SIZE)
+        self.button_font = get_font(FONT_BUTTON_SIZE)
+        self.subtitle_font = get_font(FONT_NORMAL_SIZE)
 
         # Load AI-generated complete menu scene
         assets_path = Path(__file__).parent.parent.parent / "assets" / "images" / "menu"
@@ -67,16 +68,17 @@ class MainMenu:
             # Try to load the AI-generated complete scene first
             complete_scene_path = assets_path / "complete_menu_scene.png"
             if complete_scene_path.exists():
-                self.menu_background = pygame.image.load(str(complete_scene_path))
+                self.menu_background = pygame.image.load(str(complete_scene_path)).convert()
                 # Scale to fit screen perfectly
                 self.menu_background = pygame.transform.scale(self.menu_background, (WINDOW_WIDTH, WINDOW_HEIGHT))
                 logger.info("AI-generated menu background loaded successfully")
             else:
-                # Fallback to old assets
-                self.castle_bg = pygame.image.load(str(assets_path / "castle_background.png"))
-                self.oak_tree = pygame.image.load(str(assets_path / "oak_tree.png"))
-                self.knight = pygame.image.load(str(assets_path / "knight_resting.png"))
-                self.campfire = pygame.image.load(str(assets_path / "campfire.png"))
+                # Fallback to old assets, converted once to the display format so
+                # per-frame blits skip pixel format conversion
+                self.castle_bg = pygame.image.load(str(assets_path / "castle_background.png")).convert()
+                self.oak_tree = pygame.image.load(str(assets_path / "oak_tree.png")).convert_alpha()
+                self.knight = pygame.image.load(str(assets_path / "knight_resting.png")).convert_alpha()
+                self.campfire = pygame.image.load(str(assets_path / "campfire.png")).convert_alpha()
                 self.menu_background = None
                 logger.info("Menu pixel art assets loaded successfully")
         except Exception as e:
@@ -246,7 +248,7 @@ class MainMenu:
             button.draw(self.screen)
 
         # Footer text with shadow
-        footer_font = pygame.font.Font(None, 20)
+        footer_font = get_font(20)
         footer_text = footer_font.render("A peaceful city-building experience", True, (20, 15, 10))
         footer_rect = footer_text.get_rect(center=(WINDOW_WIDTH // 2 + 1, WINDOW_HEIGHT - 49))
         self.screen.blit(footer_text, footer_rect)
@@ -308,7 +310,7 @@ class MainMenu:
         self.screen.blit(input_text, input_rect)
 
         # Instructions
-        instruction_font = pygame.font.Font(None, 20)
+        instruction_font = get_font(20)
         instruction_text = instruction_font.render("Press ENTER to start | ESC to cancel", True, (200, 190, 170))
         instruction_rect = instruction_text.get_rect(center=(WINDOW_WIDTH // 2, dialog_y + dialog_height - 30))
         self.screen.blit(instruction_text, instruction_rect)
@@ -340,7 +342,7 @@ class MainMenu:
         self.screen.blit(title_text, title_rect)
 
         # List saves
-        list_font = pygame.font.Font(None, 28)
+        list_font = get_font(28)
         start_y = dialog_y + 70
         for i, save in enumerate(self.available_saves[:8]):  # Show max 8 saves
             y = start_y + i * 40
@@ -355,12 +357,12 @@ class MainMenu:
             self.screen.blit(save_text, (dialog_x + 30, y))
 
             # Timestamp
-            timestamp_font = pygame.font.Font(None, 18)
+            timestamp_font = get_font(18)
             timestamp_text = timestamp_font.render(save['timestamp'][:19].replace('T', ' '), True, (150, 140, 120))
             self.screen.blit(timestamp_text, (dialog_x + 30, y + 20))
 
         # Instructions
-        instruction_font = pygame.font.Font(None, 20)
+        instruction_font = get_font(20)
         instruction_text = instruction_font.render("Use UP/DOWN arrows | ENTER to load | ESC to cancel", True, (200, 190, 170))
         instruction_rect = instruction_text.get_rect(center=(WINDOW_WIDTH // 2, dialog_y + dialog_height - 30))
         self.screen.blit(instruction_text, instruction_rect)
@@ -6,6 +6,7 @@ Accessed by pressing ESC during gameplay.
 import pygame
 from config.settings import *
 from src.core.logger import logger
+from src.ui.fonts import get_font
 
 
 class PauseMenuButton:
@@ -50,8 +51,8 @@ class PauseMenu:
 
         # Initialize fonts
         pygame.font.init()
-        self.title_font = pygame.font.Font(None, FONT_TITLE_SIZE)
-        self.button_font = pygame.font.Font(None, FONT_BUTTON_SIZE)
+        self.title_font = get_font(FONT_TITLE_SIZE)
+        self.button_font = get_font(FONT_BUTTON_SIZE)
 
         # Create buttons
         button_width = 300
@@ -128,7 +129,7 @@ class PauseMenu:
             button.draw(self.screen)
 
         # Hint text
-        hint_font = pygame.font.Font(None, 20)
+        hint_font = get_font(20)
         hint_text = hint_font.render("Press ESC to resume", True, (200, 190, 170))
         hint_rect = hint_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT - 50))
         self.screen.blit(hint_text, hint_rect)
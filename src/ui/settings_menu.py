@@ -5,9 +5,35 @@ Settings menu for My Kingdom with music controls.
 import pygame
 from config.settings import *
 from src.core.logger import logger
+from src.ui.fonts import get_font
 from src.audio.music_manager import get_music_manager
 
 
+# Event types the settings screen reacts to
+HANDLED_EVENTS = (
+    pygame.QUIT, pygame.KEYDOWN, pygame.VIDEOEXPOSE,
+    pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+)
+
+# Room reserved right of a widget for its value text ("100%", "OFF")
+VALUE_TEXT_WIDTH = 80
+
+
+def _label_surface(widget, font):
+    """Render a widget's static label once and reuse it every frame."""
+    if widget._label_surf is None:
+        widget._label_surf = font.render(widget.label, True, (255, 240, 200))
+    return widget._label_surf
+
+
+def _value_surface(widget, font, text):
+    """Return the rendered value text, re-rendering only strings not seen before."""
+    surf = widget._value_surfs.get(text)
+    if surf is None:
+        surf = widget._value_surfs[text] = font.render(text, True, (255, 255, 255))
+    return surf
+
+
 class Slider:
     """A draggable slider for volume control."""
 
@@ -21,6 +47,27 @@ class Slider:
         self.track_rect = pygame.Rect(x, y + height // 3, width, height // 3)
         self.handle_radius = height // 2
         self.handle_x = self._value_to_x(initial_val)
+        # Squared grab radius, so hit tests need no square root
+        self._hit_r2 = (self.handle_radius + 5) ** 2
+        # Screen area that changes when the value does: track, handle overhang and value text
+        self.bounds = pygame.Rect(x - self.handle_radius, y,
+                                  width + self.handle_radius + 20 + VALUE_TEXT_WIDTH, height)
+        self._label_surf = None
+        self._value_surfs = {}
+        # Off-screen composition of everything inside bounds, redrawn only after a change
+        self._cache_surf = pygame.Surface(self.bounds.size, pygame.SRCALPHA)
+        self._cache_dirty = True
+        # Handle (fill plus outline) rasterized once per state, then only blitted
+        self._handle_surf_normal = self._handle_sprite((200, 180, 140))
+        self._handle_surf_active = self._handle_sprite((255, 220, 150))
+
+    def _handle_sprite(self, color):
+        """Pre-render the handle circle and its accent outline on a transparent square."""
+        r = self.handle_radius
+        surf = pygame.Surface((2 * r + 4, 2 * r + 4), pygame.SRCALPHA)
+        pygame.draw.circle(surf, color, (r + 2, r + 2), r)
+        pygame.draw.circle(surf, COLOR_ACCENT, (r + 2, r + 2), r, 2)
+        return surf
 
     def _value_to_x(self, value):
         ratio = (value - self.min_val) / (self.max_val - self.min_val)
@@ -33,35 +80,48 @@ class Slider:
 
     def handle_event(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN:
-            handle_pos = (self.handle_x, self.rect.centery)
-            distance = ((event.pos[0] - handle_pos[0]) ** 2 + (event.pos[1] - handle_pos[1]) ** 2) ** 0.5
-            if distance <= self.handle_radius + 5:
+            dx = event.pos[0] - self.handle_x
+            dy = event.pos[1] - self.rect.centery
+            if dx * dx + dy * dy <= self._hit_r2:
                 self.dragging = True
+                self._cache_dirty = True
                 return True
         elif event.type == pygame.MOUSEBUTTONUP:
             if self.dragging:
                 self.dragging = False
+                self._cache_dirty = True
                 return True
         elif event.type == pygame.MOUSEMOTION:
             if self.dragging:
                 self.handle_x = max(self.rect.x, min(self.rect.x + self.rect.width, event.pos[0]))
                 self.value = self._x_to_value(self.handle_x)
+                self._cache_dirty = True
                 return True
         return False
 
-    def draw(self, screen, font):
-        label_surf = font.render(self.label, True, (255, 240, 200))
-        screen.blit(label_surf, (self.rect.x, self.rect.y - 30))
-        pygame.draw.rect(screen, (80, 70, 60), self.track_rect, border_radius=5)
+    def _render_cache(self, font):
+        """Compose track, handle and value text into the cache surface (bounds-relative)."""
+        surf = self._cache_surf
+        surf.fill((0, 0, 0, 0))
+        ox, oy = self.bounds.topleft
+        track_rect = self.track_rect.move(-ox, -oy)
+        pygame.draw.rect(surf, (80, 70, 60), track_rect, border_radius=5)
         filled_width = self.handle_x - self.rect.x
-        filled_rect = pygame.Rect(self.rect.x, self.track_rect.y, filled_width, self.track_rect.height)
-        pygame.draw.rect(screen, COLOR_ACCENT, filled_rect, border_radius=5)
-        handle_color = (255, 220, 150) if self.dragging else (200, 180, 140)
-        pygame.draw.circle(screen, handle_color, (self.handle_x, self.rect.centery), self.handle_radius)
-        pygame.draw.circle(screen, COLOR_ACCENT, (self.handle_x, self.rect.centery), self.handle_radius, 2)
-        value_text = f"{int(self.value * 100)}%"
-        value_surf = font.render(value_text, True, (255, 255, 255))
-        screen.blit(value_surf, (self.rect.x + self.rect.width + 20, self.rect.y + 5))
+        filled_rect = pygame.Rect(track_rect.x, track_rect.y, filled_width, track_rect.height)
+        pygame.draw.rect(surf, COLOR_ACCENT, filled_rect, border_radius=5)
+        handle_surf = self._handle_surf_active if self.dragging else self._handle_surf_normal
+        offset = self.handle_radius + 2
+        surf.blit(handle_surf, (self.handle_x - ox - offset, self.rect.centery - oy - offset))
+        value_surf = _value_surface(self, font, f"{int(self.value * 100)}%")
+        surf.blit(value_surf, (self.rect.x + self.rect.width + 20 - ox, self.rect.y + 5 - oy))
+
+    def draw(self, font):
+        """Return the slider as (surface, pos) pairs to blit, re-composing it only after a change."""
+        if self._cache_dirty:
+            self._render_cache(font)
+            self._cache_dirty = False
+        return [(_label_surface(self, font), (self.rect.x, self.rect.y - 30)),
+                (self._cache_surf, self.bounds.topleft)]
 
 
 class Toggle:
@@ -72,6 +132,13 @@ class Toggle:
         self.state = initial_state
         self.label = label
         self.is_hovered = False
+        # Screen area that changes when the state does: switch and ON/OFF text
+        self.bounds = pygame.Rect(x, y, width + 20 + VALUE_TEXT_WIDTH, height)
+        self._label_surf = None
+        self._value_surfs = {}
+        # Off-screen composition of everything inside bounds, redrawn only after a change
+        self._cache_surf = pygame.Surface(self.bounds.size, pygame.SRCALPHA)
+        self._cache_dirty = True
 
     def handle_event(self, event):
         if event.type == pygame.MOUSEMOTION:
@@ -79,20 +146,31 @@ class Toggle:
         elif event.type == pygame.MOUSEBUTTONDOWN:
             if self.is_hovered and event.button == 1:
                 self.state = not self.state
+                self._cache_dirty = True
                 return True
         return False
 
-    def draw(self, screen, font):
-        label_surf = font.render(self.label, True, (255, 240, 200))
-        screen.blit(label_surf, (self.rect.x, self.rect.y - 30))
+    def _render_cache(self, font):
+        """Compose switch and ON/OFF text into the cache surface (bounds-relative)."""
+        surf = self._cache_surf
+        surf.fill((0, 0, 0, 0))
+        ox, oy = self.bounds.topleft
+        rect = self.rect.move(-ox, -oy)
         bg_color = COLOR_ACCENT if self.state else (80, 70, 60)
-        pygame.draw.rect(screen, bg_color, self.rect, border_radius=self.rect.height // 2)
-        switch_x = self.rect.x + self.rect.width - self.rect.height + 5 if self.state else self.rect.x + 5
+        pygame.draw.rect(surf, bg_color, rect, border_radius=rect.height // 2)
+        switch_x = rect.x + rect.width - rect.height + 5 if self.state else rect.x + 5
         switch_color = (255, 255, 255) if self.state else (150, 140, 130)
-        pygame.draw.circle(screen, switch_color, (switch_x + self.rect.height // 2 - 5, self.rect.centery), self.rect.height // 2 - 5)
-        state_text = "ON" if self.state else "OFF"
-        state_surf = font.render(state_text, True, (255, 255, 255))
-        screen.blit(state_surf, (self.rect.x + self.rect.width + 20, self.rect.y + 5))
+        pygame.draw.circle(surf, switch_color, (switch_x + rect.height // 2 - 5, rect.centery), rect.height // 2 - 5)
+        state_surf = _value_surface(self, font, "ON" if self.state else "OFF")
+        surf.blit(state_surf, (rect.x + rect.width + 20, rect.y + 5))
+
+    def draw(self, font):
+        """Return the toggle as (surface, pos) pairs to blit, re-composing it only after a change."""
+        if self._cache_dirty:
+            self._render_cache(font)
+            self._cache_dirty = False
+        return [(_label_surface(self, font), (self.rect.x, self.rect.y - 30)),
+                (self._cache_surf, self.bounds.topleft)]
 
 
 class SettingsMenu:
@@ -103,53 +181,90 @@ class SettingsMenu:
         self.running = True
         self.music_manager = get_music_manager()
         pygame.font.init()
-        self.title_font = pygame.font.Font(None, 48)
-        self.label_font = pygame.font.Font(None, 28)
-        self.button_font = pygame.font.Font(None, 32)
+        self.title_font = get_font(48)
+        self.label_font = get_font(28)
+        self.button_font = get_font(32)
         center_x = WINDOW_WIDTH // 2
         self.music_toggle = Toggle(center_x - 100, 200, 80, 40, self.music_manager.music_enabled, "Music")
         self.volume_slider = Slider(center_x - 200, 300, 400, 40, 0.0, 1.0, self.music_manager.music_volume, "Music Volume")
         self.back_button_rect = pygame.Rect(center_x - 100, 450, 200, 60)
         self.back_button_hovered = False
+
+        # Static backdrop (fill + title) rendered once and blitted as the clear step
+        self.background = pygame.Surface(self.screen.get_size()).convert()
+        self.background.fill((30, 25, 20))
+        title_text = self.title_font.render("Settings", True, (255, 240, 200))
+        self.background.blit(title_text, title_text.get_rect(center=(WINDOW_WIDTH // 2, 80)))
+        self.back_text = self.button_font.render("Back", True, (255, 240, 200))
+
+        # Screen areas to present next frame; None means the whole display
+        self.dirty_rects = None
         logger.info("Settings menu initialized")
 
     def handle_events(self):
-        for event in pygame.event.get():
+        # Only fetch the event types this screen reacts to, then drop the rest
+        events = pygame.event.get(HANDLED_EVENTS)
+        pygame.event.clear(pump=False)
+        for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
                 return
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     self.running = False
-            if self.music_toggle.handle_event(event):
-                self.music_manager.toggle_enabled()
-            if self.volume_slider.handle_event(event):
-                self.music_manager.set_volume(self.volume_slider.value)
-            if event.type == pygame.MOUSEMOTION:
-                self.back_button_hovered = self.back_button_rect.collidepoint(event.pos)
+            elif event.type == pygame.VIDEOEXPOSE:
+                self.dirty_rects = None
+            elif event.type == pygame.MOUSEMOTION:
+                self.music_toggle.handle_event(event)
+                self._update_slider(event)
+                hovered = self.back_button_rect.collidepoint(event.pos)
+                if hovered != self.back_button_hovered:
+                    self.back_button_hovered = hovered
+                    self._mark_dirty(self.back_button_rect.inflate(6, 6))
             elif event.type == pygame.MOUSEBUTTONDOWN:
+                if self.music_toggle.handle_event(event):
+                    self.music_manager.toggle_enabled()
+                    self._mark_dirty(self.music_toggle.bounds)
+                self._update_slider(event)
                 if self.back_button_hovered and event.button == 1:
                     self.running = False
+            elif event.type == pygame.MOUSEBUTTONUP:
+                self._update_slider(event)
+
+    def _update_slider(self, event):
+        """Forward a mouse event to the volume slider and apply any change."""
+        if self.volume_slider.handle_event(event):
+            self.music_manager.set_volume(self.volume_slider.value)
+            self._mark_dirty(self.volume_slider.bounds)
+
+    def _mark_dirty(self, rect):
+        """Queue a screen area for the next display update."""
+        if self.dirty_rects is not None:
+            self.dirty_rects.append(rect)
 
     def draw(self):
-        self.screen.fill((30, 25, 20))
-        title_text = self.title_font.render("Settings", True, (255, 240, 200))
-        title_rect = title_text.get_rect(center=(WINDOW_WIDTH // 2, 80))
-        self.screen.blit(title_text, title_rect)
-        self.music_toggle.draw(self.screen, self.label_font)
-        self.volume_slider.draw(self.screen, self.label_font)
+        self.screen.blit(self.background, (0, 0))
+        # Widgets come back as pre-composed surfaces; they and all text go out in one batch
+        text_blits = self.music_toggle.draw(self.label_font)
+        text_blits += self.volume_slider.draw(self.label_font)
         button_color = (140, 110, 80) if self.back_button_hovered else (100, 80, 60)
         pygame.draw.rect(self.screen, COLOR_ACCENT, self.back_button_rect.inflate(6, 6), border_radius=8)
         pygame.draw.rect(self.screen, button_color, self.back_button_rect, border_radius=8)
-        button_text = self.button_font.render("Back", True, (255, 240, 200))
-        button_text_rect = button_text.get_rect(center=self.back_button_rect.center)
-        self.screen.blit(button_text, button_text_rect)
+        text_blits.append((self.back_text, self.back_text.get_rect(center=self.back_button_rect.center)))
+        self.screen.blits(text_blits, doreturn=False)
 
     def run(self):
         clock = pygame.time.Clock()
         while self.running:
             self.handle_events()
-            self.draw()
-            pygame.display.flip()
+            # Nothing animates here, so only redraw and present after a change
+            if self.dirty_rects is None:
+                self.draw()
+                pygame.display.flip()
+                self.dirty_rects = []
+            elif self.dirty_rects:
+                self.draw()
+                pygame.display.update(self.dirty_rects)
+                self.dirty_rects = []
             clock.tick(FPS)
         logger.info("Settings menu closed")
@@ -13,6 +13,7 @@ import pygame
 from typing import Optional, Tuple, Dict
 from src.world.world_generator_advanced import TieredWorldGenerator, WorldTile
 from src.world.biomes import BIOME_DEFINITIONS, BiomeType
+from src.ui.fonts import get_font
 from src.core.logger import logger
 
 
@@ -58,9 +59,9 @@ class WorldSelectionScreen:
         self.local_selected_y = 50
 
         # UI
-        self.title_font = pygame.font.Font(None, 48)
-        self.info_font = pygame.font.Font(None, 24)
-        self.small_font = pygame.font.Font(None, 18)
+        self.title_font = get_font(48)
+        self.info_font = get_font(24)
+        self.small_font = get_font(18)
 
         self.running = True
         self.confirmed = False
@@ -9,6 +9,7 @@ Implements lessons from Songs of Syx, RimWorld, and Dwarf Fortress:
 
 import numpy as np
 from opensimplex import OpenSimplex
+from collections import Counter
 from dataclasses import dataclass
 from typing import Tuple, List, Optional
 import random
@@ -18,6 +19,19 @@ from src.world.biomes import BiomeType, get_biome_from_climate, get_biome_proper
 from src.core.logger import logger
 
 
+# Compact int8 terrain codes used while a map is being generated. Comparisons
+# on these run as NumPy array ops; cells are only wrapped back into TerrainType
+# when the final tile objects are built.
+TERRAIN_TYPES = tuple(TerrainType)
+TERRAIN_IDS = {terrain: i for i, terrain in enumerate(TERRAIN_TYPES)}
+GRASS_ID = TERRAIN_IDS[TerrainType.GRASS]
+WATER_ID = TERRAIN_IDS[TerrainType.WATER]
+SAND_ID = TERRAIN_IDS[TerrainType.SAND]
+FOREST_ID = TERRAIN_IDS[TerrainType.FOREST]
+STONE_ID = TERRAIN_IDS[TerrainType.STONE]
+DIRT_ID = TERRAIN_IDS[TerrainType.DIRT]
+
+
 @dataclass
 class WorldTile:
     """A tile on the world map (large scale)."""
@@ -52,6 +66,7 @@ class TieredWorldGenerator:
     def __init__(self, seed: Optional[int] = None):
         self.seed = seed if seed is not None else random.randint(0, 999999)
         random.seed(self.seed)
+        self.rng = np.random.default_rng(self.seed)
 
         # Multiple noise generators with different seeds for variety
         self.elevation_noise = OpenSimplex(seed=self.seed)
@@ -59,6 +74,10 @@ class TieredWorldGenerator:
         self.rainfall_noise = OpenSimplex(seed=self.seed + 2)
         self.detail_noise = OpenSimplex(seed=self.seed + 3)
 
+        # Optional world-wide region detail noise (see precompute_detail_field)
+        self._detail_field: Optional[np.ndarray] = None
+        self._detail_scale = 0.1
+
         logger.info(f"Tiered World Generator initialized with seed: {self.seed}")
 
     def generate_world_map(self, width: int = 100, height: int = 100) -> List[List[WorldTile]]:
@@ -134,48 +153,48 @@ class TieredWorldGenerator:
         logger.info(f"Generating region from world tile ({world_tile.x}, {world_tile.y})...")
         logger.info(f"  Biome: {world_tile.biome.value}, Elevation: {world_tile.elevation:.2f}")
 
-        region_tiles = []
         biome_props = get_biome_properties(world_tile.biome)
 
         # Use world tile position as offset for noise (ensures different regions are unique)
         offset_x = world_tile.x * region_width
         offset_y = world_tile.y * region_height
 
+        moisture = np.empty((region_height, region_width), dtype=np.float32)
+
+        # Generate elevation constrained by world tile
+        # SONGS OF SYX LESSON: "Semi-random with constraints"
+        elevation = self._generate_constrained_elevation(
+            offset_x, offset_y,
+            region_width, region_height,
+            world_tile.elevation,
+            adjacent_world_tiles
+        )
+
         for y in range(region_height):
-            row = []
             for x in range(region_width):
-                # Generate elevation constrained by world tile
-                # SONGS OF SYX LESSON: "Semi-random with constraints"
-                local_elevation = self._generate_constrained_elevation(
-                    x, y, offset_x, offset_y,
-                    world_tile.elevation,
-                    adjacent_world_tiles
-                )
-
                 # Moisture influenced by world rainfall
-                local_moisture = self._generate_constrained_moisture(
+                moisture[y, x] = self._generate_constrained_moisture(
                     x, y, offset_x, offset_y,
                     world_tile.rainfall
                 )
 
-                # Determine terrain type from biome, elevation, and moisture
-                terrain_type = self._get_terrain_from_biome(
-                    biome_props,
-                    local_elevation,
-                    local_moisture
-                )
+        # Determine terrain type from biome, elevation, and moisture
+        terrain = self._get_terrain_from_biome(biome_props, elevation, moisture)
 
-                tile = RegionTile(
+        region_tiles = [
+            [
+                RegionTile(
                     x=x,
                     y=y,
-                    elevation=local_elevation,
-                    moisture=local_moisture,
+                    elevation=float(elevation[y, x]),
+                    moisture=float(moisture[y, x]),
                     biome=world_tile.biome,
-                    terrain_type=terrain_type
+                    terrain_type=TERRAIN_TYPES[terrain_id]
                 )
-                row.append(tile)
-
-            region_tiles.append(row)
+                for x, terrain_id in enumerate(row)
+            ]
+            for y, row in enumerate(terrain.tolist())
+        ]
 
         # Post-processing for playability (Songs of Syx: ensure functionality)
         region_tiles = self._ensure_region_playability(region_tiles, biome_props)
@@ -210,13 +229,14 @@ class TieredWorldGenerator:
         region_height = len(region_tiles)
         region_width = len(region_tiles[0]) if region_height > 0 else 0
 
+        # Clamp the chunk to the region's far edges and drop indices off the near ones
         chunk_tiles = []
-        for cy in range(chunk_height):
-            for cx in range(chunk_width):
-                rx = min(chunk_x + cx, region_width - 1)
-                ry = min(chunk_y + cy, region_height - 1)
-                if 0 <= ry < region_height and 0 <= rx < region_width:
-                    chunk_tiles.append(region_tiles[ry][rx])
+        if region_width > 0:
+            xs = np.minimum(np.arange(chunk_x, chunk_x + chunk_width), region_width - 1)
+            ys = np.minimum(np.arange(chunk_y, chunk_y + chunk_height), region_height - 1)
+            xs = xs[xs >= 0].tolist()
+            ys = ys[ys >= 0].tolist()
+            chunk_tiles = [region_tiles[ry][rx] for ry in ys for rx in xs]
 
         if not chunk_tiles:
             logger.error("No valid chunk tiles found!")
@@ -225,51 +245,49 @@ class TieredWorldGenerator:
         # Analyze chunk to determine generation constraints
         avg_elevation = sum(t.elevation for t in chunk_tiles) / len(chunk_tiles)
         avg_moisture = sum(t.moisture for t in chunk_tiles) / len(chunk_tiles)
-        primary_biome = max(set(t.biome for t in chunk_tiles), key=lambda b: sum(1 for t in chunk_tiles if t.biome == b))
+        primary_biome = Counter(t.biome for t in chunk_tiles).most_common(1)[0][0]
         biome_props = get_biome_properties(primary_biome)
 
         logger.info(f"  Chunk analysis: Biome={primary_biome.value}, Avg Elev={avg_elevation:.2f}")
 
         # Generate local map
-        local_tiles = []
         offset_x = chunk_x * 1000  # Large offset for unique noise
         offset_y = chunk_y * 1000
 
+        elevation = np.empty((local_height, local_width), dtype=np.float32)
+        moisture = np.empty((local_height, local_width), dtype=np.float32)
+
         for y in range(local_height):
-            row = []
             for x in range(local_width):
                 # Fine-detail elevation
-                elevation = self._generate_local_elevation(
+                elevation[y, x] = self._generate_local_elevation(
                     x, y, offset_x, offset_y,
                     avg_elevation
                 )
 
                 # Fine-detail moisture
-                moisture = self._generate_local_moisture(
+                moisture[y, x] = self._generate_local_moisture(
                     x, y, offset_x, offset_y,
                     avg_moisture
                 )
 
-                # Terrain type
-                terrain_type = self._get_terrain_from_biome(
-                    biome_props,
-                    elevation,
-                    moisture
-                )
-
-                tile = Tile(x, y, terrain_type)
-                row.append(tile)
-
-            local_tiles.append(row)
+        # Terrain type
+        terrain = self._get_terrain_from_biome(biome_props, elevation, moisture)
 
         # CRITICAL: Songs of Syx lesson - ensure entrance points and functionality
-        local_tiles = self._ensure_local_playability(local_tiles, biome_props)
+        terrain = self._ensure_local_playability(terrain, biome_props)
 
         # Add forests in clusters (from original code)
-        local_tiles = self._add_forests(local_tiles, biome_props.tree_density)
+        terrain = self._add_forests(terrain, biome_props.tree_density)
 
         # Smooth transitions
-        local_tiles = self._smooth_terrain(local_tiles)
+        terrain = self._smooth_terrain(terrain)
+
+        # Only now wrap the terrain codes back into Tile objects
+        local_tiles = [
+            [Tile(x, y, TERRAIN_TYPES[terrain_id]) for x, terrain_id in enumerate(row)]
+            for y, row in enumerate(terrain.tolist())
+        ]
 
         # Place resource nodes on tiles
         local_tiles = self._place_resource_nodes(local_tiles, biome_props)
@@ -312,38 +330,72 @@ class TieredWorldGenerator:
 
         return max(0, min(1, rainfall))
 
+    def precompute_detail_field(
+        self,
+        world_width: int,
+        world_height: int,
+        region_width: int = 50,
+        region_height: int = 50,
+        scale: float = 0.1
+    ):
+        """
+        Precompute region detail noise for the whole world in one pass.
+
+        Regions generated afterwards slice their elevation detail out of this
+        field instead of sampling OpenSimplex again, and adjacent regions share
+        one continuous field so their borders line up.
+
+        The field holds (world_height * region_height) x (world_width * region_width)
+        float32 values, so only use it when many regions will be generated.
+        It is opt-in: the game generates a handful of regions per world, for
+        which sampling each region window directly is cheaper.
+        """
+        logger.info(f"Precomputing region detail field for {world_width}x{world_height} world...")
+
+        self._detail_scale = scale
+        self._detail_field = self._sample_detail_noise(
+            0, 0,
+            world_width * region_width,
+            world_height * region_height
+        )
+
+    def _sample_detail_noise(self, offset_x: int, offset_y: int, width: int, height: int) -> np.ndarray:
+        """
+        Sample the region detail noise for a window of the world.
+        Returns the noise contribution to elevation (30% base noise + fine detail).
+        """
+        xs = np.arange(offset_x, offset_x + width, dtype=np.float32) * np.float32(self._detail_scale)
+        ys = np.arange(offset_y, offset_y + height, dtype=np.float32) * np.float32(self._detail_scale)
+
+        # Base noise normalized to 0-1, plus fine detail at 5x the frequency
+        noise = (self.detail_noise.noise2array(xs, ys) + 1) / 2
+        detail = self.detail_noise.noise2array(xs * 5, ys * 5)
+
+        return (noise * 0.3 + detail * 0.1).astype(np.float32)
+
     def _generate_constrained_elevation(
         self,
-        x: int, y: int,
         offset_x: int, offset_y: int,
+        width: int, height: int,
         target_elevation: float,
         adjacent_tiles: Optional[dict]
-    ) -> float:
+    ) -> np.ndarray:
         """
-        Generate elevation constrained to match world tile.
+        Generate region elevation constrained to match world tile.
         Songs of Syx: "Control the randomness to resemble the world-map"
         """
-        # Generate base noise
-        noise = self.detail_noise.noise2(
-            (x + offset_x) * 0.1,
-            (y + offset_y) * 0.1
-        )
-
-        # Normalize to 0-1
-        noise = (noise + 1) / 2
+        field = self._detail_field
+        if (field is not None
+                and offset_y + height <= field.shape[0]
+                and offset_x + width <= field.shape[1]):
+            noise = field[offset_y:offset_y + height, offset_x:offset_x + width]
+        else:
+            noise = self._sample_detail_noise(offset_x, offset_y, width, height)
 
-        # Blend with target (70% target, 30% noise for variety)
-        elevation = target_elevation * 0.7 + noise * 0.3
+        # Blend with target (70% target, 30% noise for variety) plus fine detail
+        elevation = target_elevation * 0.7 + noise
 
-        # Add fine detail
-        detail = self.detail_noise.noise2(
-            (x + offset_x) * 0.5,
-            (y + offset_y) * 0.5
-        ) * 0.1
-
-        elevation += detail
-
-        return max(0, min(1, elevation))
+        return np.clip(elevation, 0, 1)
 
     def _generate_constrained_moisture(
         self,
@@ -405,36 +457,37 @@ class TieredWorldGenerator:
     def _get_terrain_from_biome(
         self,
         biome_props,
-        elevation: float,
-        moisture: float
-    ) -> TerrainType:
+        elevation: np.ndarray,
+        moisture: np.ndarray
+    ) -> np.ndarray:
         """
-        Determine terrain type based on biome properties, elevation, and moisture.
+        Determine terrain ids based on biome properties, elevation, and moisture.
         RimWorld approach: Biome defines the rules, then local variation.
+
+        Rules are applied from lowest to highest priority so later
+        assignments win, matching the original if/elif order.
         """
-        # Water at low elevations
-        if elevation < 0.25:
-            return TerrainType.WATER
+        # Default to grass (biome color will be applied during rendering)
+        terrain = np.full(elevation.shape, GRASS_ID, dtype=np.int8)
 
-        # Beach/sand transition
-        if elevation < 0.30:
-            return TerrainType.SAND
+        # Normal elevation - use biome properties
+        # Forest if high moisture and biome supports it
+        forest = (moisture > 0.6) & (self.rng.random(elevation.shape, dtype=np.float32) < biome_props.tree_density)
+        terrain[forest] = FOREST_ID
+
+        # Medium-high elevation = dirt/rocky ground
+        terrain[elevation > 0.65] = DIRT_ID
 
         # High elevation = stone/mountains (rare, only on high peaks)
-        if elevation > 0.75:
-            return TerrainType.STONE
+        terrain[elevation > 0.75] = STONE_ID
 
-        # Medium-high elevation = dirt/rocky ground
-        if elevation > 0.65:
-            return TerrainType.DIRT
+        # Beach/sand transition
+        terrain[elevation < 0.30] = SAND_ID
 
-        # Normal elevation - use biome properties
-        # Forest if high moisture and biome supports it
-        if moisture > 0.6 and random.random() < biome_props.tree_density:
-            return TerrainType.FOREST
+        # Water at low elevations
+        terrain[elevation < 0.25] = WATER_ID
 
-        # Default to grass (biome color will be applied during rendering)
-        return TerrainType.GRASS
+        return terrain
 
     def _ensure_region_playability(self, region_tiles: List[List[RegionTile]], biome_props) -> List[List[RegionTile]]:
         """
@@ -462,51 +515,33 @@ class TieredWorldGenerator:
 
         return region_tiles
 
-    def _ensure_local_playability(self, local_tiles: List[List[Tile]], biome_props) -> List[List[Tile]]:
+    def _ensure_local_playability(self, terrain: np.ndarray, biome_props) -> np.ndarray:
         """
         Ensure the local map is playable.
         Songs of Syx: Ensure entrance points work and resources are accessible.
         """
-        height = len(local_tiles)
-        width = len(local_tiles[0]) if height > 0 else 0
+        if terrain.size == 0:
+            return terrain
 
-        # Ensure edges have accessible entrance points (not all water or stone)
-        for x in range(width):
-            # Top edge
-            if local_tiles[0][x].terrain_type == TerrainType.WATER:
-                local_tiles[0][x].terrain_type = TerrainType.GRASS
+        height, width = terrain.shape
 
-            # Bottom edge
-            if local_tiles[height - 1][x].terrain_type == TerrainType.WATER:
-                local_tiles[height - 1][x].terrain_type = TerrainType.GRASS
-
-        for y in range(height):
-            # Left edge
-            if local_tiles[y][0].terrain_type == TerrainType.WATER:
-                local_tiles[y][0].terrain_type = TerrainType.GRASS
-
-            # Right edge
-            if local_tiles[y][width - 1].terrain_type == TerrainType.WATER:
-                local_tiles[y][width - 1].terrain_type = TerrainType.GRASS
+        # Ensure edges have accessible entrance points (not all water or stone)
+        for edge in (terrain[0, :], terrain[-1, :], terrain[:, 0], terrain[:, -1]):
+            edge[edge == WATER_ID] = GRASS_ID
 
         # Ensure at least one large buildable area in center
         center_x, center_y = width // 2, height // 2
-        for dy in range(-5, 6):
-            for dx in range(-5, 6):
-                x, y = center_x + dx, center_y + dy
-                if 0 <= x < width and 0 <= y < height:
-                    if local_tiles[y][x].terrain_type not in [TerrainType.GRASS, TerrainType.DIRT]:
-                        local_tiles[y][x].terrain_type = TerrainType.GRASS
+        center = terrain[max(0, center_y - 5):center_y + 6, max(0, center_x - 5):center_x + 6]
+        center[(center != GRASS_ID) & (center != DIRT_ID)] = GRASS_ID
 
-        return local_tiles
+        return terrain
 
-    def _add_forests(self, tiles: List[List[Tile]], tree_density: float) -> List[List[Tile]]:
+    def _add_forests(self, terrain: np.ndarray, tree_density: float) -> np.ndarray:
         """Add forest clusters based on biome tree density."""
-        if tree_density < 0.05:
-            return tiles
+        if tree_density < 0.05 or terrain.size == 0:
+            return terrain
 
-        height = len(tiles)
-        width = len(tiles[0]) if height > 0 else 0
+        height, width = terrain.shape
 
         num_forests = int(20 * tree_density)
 
@@ -514,39 +549,32 @@ class TieredWorldGenerator:
             center_x = random.randint(0, width - 1)
             center_y = random.randint(0, height - 1)
 
-            if tiles[center_y][center_x].terrain_type == TerrainType.GRASS:
+            if terrain[center_y, center_x] == GRASS_ID:
                 radius = random.randint(3, max(3, int(8 * tree_density)))
 
-                for dy in range(-radius, radius + 1):
-                    for dx in range(-radius, radius + 1):
-                        nx, ny = center_x + dx, center_y + dy
+                x0, x1 = max(0, center_x - radius), min(width, center_x + radius + 1)
+                y0, y1 = max(0, center_y - radius), min(height, center_y + radius + 1)
+                ys, xs = np.ogrid[y0:y1, x0:x1]
 
-                        if 0 <= nx < width and 0 <= ny < height:
-                            distance = (dx * dx + dy * dy) ** 0.5
-                            if distance <= radius and random.random() > 0.3:
-                                if tiles[ny][nx].terrain_type == TerrainType.GRASS:
-                                    tiles[ny][nx].terrain_type = TerrainType.FOREST
+                patch = terrain[y0:y1, x0:x1]
+                in_circle = (xs - center_x) ** 2 + (ys - center_y) ** 2 <= radius * radius
+                planted = in_circle & (self.rng.random(patch.shape, dtype=np.float32) > 0.3) & (patch == GRASS_ID)
+                patch[planted] = FOREST_ID
 
-        return tiles
+        return terrain
 
-    def _smooth_terrain(self, tiles: List[List[Tile]]) -> List[List[Tile]]:
-        """Smooth terrain transitions."""
-        height = len(tiles)
-        width = len(tiles[0]) if height > 0 else 0
-
-        original = [[tile.terrain_type for tile in row] for row in tiles]
+    def _smooth_terrain(self, terrain: np.ndarray) -> np.ndarray:
+        """Smooth terrain transitions by removing isolated single water tiles."""
+        water = terrain == WATER_ID
 
-        for y in range(1, height - 1):
-            for x in range(1, width - 1):
-                if original[y][x] == TerrainType.WATER:
-                    neighbors = [
-                        original[y - 1][x], original[y + 1][x],
-                        original[y][x - 1], original[y][x + 1]
-                    ]
-                    if all(n != TerrainType.WATER for n in neighbors):
-                        tiles[y][x].terrain_type = TerrainType.GRASS
+        isolated = (
+            water[1:-1, 1:-1]
+            & ~water[:-2, 1:-1] & ~water[2:, 1:-1]
+            & ~water[1:-1, :-2] & ~water[1:-1, 2:]
+        )
+        terrain[1:-1, 1:-1][isolated] = GRASS_ID
 
-        return tiles
+        return terrain
 
     def _place_resource_nodes(self, tiles: List[List[Tile]], biome_props) -> List[List[Tile]]:
         """
@@ -4,9 +4,99 @@ Handles tile-based world rendering and management.
 """
 
 import pygame
+import numpy as np
 import json
+from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
 from src.core.logger import logger
+from src.core.numba_compat import HAS_NUMBA, njit
+
+
+# Terrain is cached as square chunks of CHUNK_SIZE x CHUNK_SIZE tiles
+CHUNK_SIZE = 16
+# Least recently used chunks beyond this count are dropped from the cache
+MAX_CACHED_CHUNKS = 64
+
+# Terrain names; terrain_map stores each tile as an index into this list
+TERRAIN_TYPES = ["grass", "grass_flowers", "grass_dark", "dirt", "dirt_path",
+                 "desert_sand", "stone_gray", "stone_path", "water_shallow",
+                 "water_deep", "forest_floor", "snow"]
+TERRAIN_IDS = {name: i for i, name in enumerate(TERRAIN_TYPES)}
+
+# Object sprite names, in the order they are drawn
+OBJECT_TYPES = ["tree_oak", "tree_pine", "tree_small", "rock_large", "rock_small",
+                "bush_green", "house_small", "well"]
+OBJECT_IDS = {name: i for i, name in enumerate(OBJECT_TYPES)}
+
+# Placeholder tile surfaces shared between terrains: {(color, tile_size): surface}
+_placeholder_cache = {}
+
+
+if HAS_NUMBA:
+    @njit(cache=True)
+    def _enumerate_runs(terrain_ids, start_x, start_y, end_x, end_y, tile_size, origin_x, origin_y):
+        """
+        Split each row of a tile rectangle into runs of identical terrain.
+        Returns the id, length and pixel position of every run, with positions
+        relative to (origin_x, origin_y) in map pixels.
+        """
+        count = (end_x - start_x) * (end_y - start_y)
+        out_ids = np.empty(count, np.uint8)
+        out_lengths = np.empty(count, np.int32)
+        out_xy = np.empty((count, 2), np.int32)
+        k = 0
+        for y in range(start_y, end_y):
+            x = start_x
+            while x < end_x:
+                terrain_id = terrain_ids[y, x]
+                length = 1
+                while x + length < end_x and terrain_ids[y, x + length] == terrain_id:
+                    length += 1
+                out_ids[k] = terrain_id
+                out_lengths[k] = length
+                out_xy[k, 0] = x * tile_size - origin_x
+                out_xy[k, 1] = y * tile_size - origin_y
+                k += 1
+                x += length
+        return out_ids[:k], out_lengths[:k], out_xy[:k]
+else:
+    def _enumerate_runs(terrain_ids, start_x, start_y, end_x, end_y, tile_size, origin_x, origin_y):
+        """
+        Split each row of a tile rectangle into runs of identical terrain.
+        Returns the id, length and pixel position of every run, with positions
+        relative to (origin_x, origin_y) in map pixels.
+        """
+        block = terrain_ids[start_y:end_y, start_x:end_x]
+        height, width = block.shape
+
+        # A run starts at the first column and wherever the id changes
+        starts = np.ones((height, width), dtype=bool)
+        starts[:, 1:] = block[:, 1:] != block[:, :-1]
+        ys, xs = np.nonzero(starts)
+
+        # Every row begins a new run, so each run ends where the next one starts
+        flat = ys * width + xs
+        out_lengths = np.diff(np.append(flat, height * width)).astype(np.int32)
+
+        out_xy = np.empty((flat.size, 2), np.int32)
+        out_xy[:, 0] = (xs + start_x) * tile_size - origin_x
+        out_xy[:, 1] = (ys + start_y) * tile_size - origin_y
+        return block[ys, xs], out_lengths, out_xy
+
+
+@dataclass
+class ViewBounds:
+    """Camera position and visible tile range for one frame."""
+
+    # Built once per drawn view; slots keep it small and its fields quick to read
+    __slots__ = ("cam_x", "cam_y", "start_x", "start_y", "end_x", "end_y")
+    cam_x: int
+    cam_y: int
+    start_x: int
+    start_y: int
+    end_x: int
+    end_y: int
 
 
 class WorldMap:
@@ -25,66 +115,119 @@ class WorldMap:
         self.height = height
         self.tile_size = tile_size
 
-        # Map data: 2D array of tile types
-        self.terrain_map = [["grass" for _ in range(width)] for _ in range(height)]
+        # Map data: 2D array of terrain ids (indices into TERRAIN_TYPES)
+        self.terrain_map = np.full((height, width), TERRAIN_IDS["grass"], dtype=np.uint8)
 
         # Objects on the map (trees, rocks, etc.)
         self.objects = []  # List of (x, y, object_type)
+        # Object positions (N, 2) and type ids (N,) for vectorized culling;
+        # rebuilt from self.objects when set to None
+        self._obj_xy = None
+        self._obj_types = None
 
         # Loaded tile images
         self.tiles = {}
         self.object_images = {}
 
+        # Tile images indexed by terrain id, with missing terrains falling back to grass
+        self._tile_by_id = [None] * len(TERRAIN_TYPES)
+
+        # Pre-composited terrain chunks keyed by (chunk_x, chunk_y), in LRU order
+        self._chunks = OrderedDict()
+        # Pre-tiled strips for runs of identical terrain: {(terrain_id, length): surface}
+        self._run_strips = {}
+
         # Camera position (in pixels)
         self.camera_x = 0
         self.camera_y = 0
 
+        # GPU textures used by render_gpu when a renderer was passed to load_assets
+        self._use_gpu = False
+        self._tile_textures = []
+        self._object_textures = []
+
+        # Last rendered frame, reused while the map and camera are unchanged
+        self._last_frame = None
+        self._last_camera = None
+        self._dirty = True
+
         logger.info(f"World map created: {width}x{height} tiles")
 
-    def load_assets(self):
-        """Load all tile and object images."""
+    def load_assets(self, renderer=None):
+        """
+        Load all tile and object images.
+
+        Args:
+            renderer: Optional pygame._sdl2.video.Renderer. When given, the
+                      images are also uploaded as textures for render_gpu.
+        """
         assets_dir = Path("assets/images/world")
 
         if not assets_dir.exists():
             logger.warning("World assets directory not found. Generating placeholder tiles...")
             self._generate_placeholder_tiles()
+            self._rebuild_terrain_cache()
+            if renderer is not None:
+                self._create_textures(renderer)
             return
 
-        # Load terrain tiles
-        terrain_types = ["grass", "grass_flowers", "grass_dark", "dirt", "dirt_path",
-                        "desert_sand", "stone_gray", "stone_path", "water_shallow",
-                        "water_deep", "forest_floor", "snow"]
+        # Convert to the display's pixel format so blits take SDL's fast path
+        # (only possible once a display mode has been set)
+        can_convert = pygame.display.get_surface() is not None
 
-        for terrain in terrain_types:
+        # Load terrain tiles
+        for terrain in TERRAIN_TYPES:
             tile_path = assets_dir / f"{terrain}.png"
             if tile_path.exists():
                 try:
-                    self.tiles[terrain] = pygame.image.load(str(tile_path))
-                    self.tiles[terrain] = pygame.transform.scale(
-                        self.tiles[terrain], (self.tile_size, self.tile_size)
-                    )
+                    img = self._scale_image(pygame.image.load(str(tile_path)), self.tile_size)
+                    self.tiles[terrain] = img.convert() if can_convert else img
                     logger.info(f"Loaded tile: {terrain}")
                 except Exception as e:
                     logger.error(f"Failed to load {terrain}: {e}")
 
         # Load object sprites
-        objects = ["tree_oak", "tree_pine", "tree_small", "rock_large", "rock_small",
-                  "bush_green", "house_small", "well"]
-
-        for obj in objects:
+        for obj in OBJECT_TYPES:
             obj_path = assets_dir / f"{obj}.png"
             if obj_path.exists():
                 try:
-                    self.object_images[obj] = pygame.image.load(str(obj_path))
                     # Objects are typically 2x2 tiles
-                    self.object_images[obj] = pygame.transform.scale(
-                        self.object_images[obj], (self.tile_size * 2, self.tile_size * 2)
-                    )
+                    img = self._scale_image(pygame.image.load(str(obj_path)), self.tile_size * 2)
+                    self.object_images[obj] = img.convert_alpha() if can_convert else img
                     logger.info(f"Loaded object: {obj}")
                 except Exception as e:
                     logger.error(f"Failed to load {obj}: {e}")
 
         logger.info(f"Loaded {len(self.tiles)} terrain tiles and {len(self.object_images)} objects")
+        self._rebuild_terrain_cache()
+        if renderer is not None:
+            self._create_textures(renderer)
+
+    def _create_textures(self, renderer):
+        """Upload tile and object images as GPU textures for render_gpu."""
+        from pygame._sdl2.video import Texture
+
+        # Surfaces shared between terrains (e.g. the grass fallback) share a texture
+        uploaded = {}
+
+        def upload(surface):
+            if surface is None:
+                return None
+            if id(surface) not in uploaded:
+                uploaded[id(surface)] = Texture.from_surface(renderer, surface)
+            return uploaded[id(surface)]
+
+        self._tile_textures = [upload(surface) for surface in self._tile_by_id]
+        self._object_textures = [upload(self.object_images.get(obj)) for obj in OBJECT_TYPES] + [None]
+        self._use_gpu = True
+        logger.info(f"Uploaded {len(uploaded)} world textures to the GPU")
+
+    @staticmethod
+    def _scale_image(img, size):
+        """Scale an image to size x size, leaving it alone if it already matches."""
+        if img.get_size() == (size, size):
+            return img
+        return pygame.transform.scale(img, (size, size))
 
     def _generate_placeholder_tiles(self):
         """Generate simple colored placeholder tiles."""
@@ -95,44 +238,144 @@ class WorldMap:
             "stone_gray": (128, 128, 128),
         }
 
-        for tile_name, color in colors.items():
-            surface = pygame.Surface((self.tile_size, self.tile_size))
-            surface.fill(color)
-            # Add border for visibility
-            pygame.draw.rect(surface, (0, 0, 0), surface.get_rect(), 1)
+        for tile_name in TERRAIN_TYPES:
+            # Terrains without a color of their own get the grass fallback they always had
+            color = colors.get(tile_name, colors["grass"])
+
+            # Identical placeholders share one surface
+            key = (color, self.tile_size)
+            surface = _placeholder_cache.get(key)
+            if surface is None:
+                surface = pygame.Surface((self.tile_size, self.tile_size))
+                surface.fill(color)
+                # Add border for visibility
+                pygame.draw.rect(surface, (0, 0, 0), surface.get_rect(), 1)
+                _placeholder_cache[key] = surface
+
             self.tiles[tile_name] = surface
 
+    def _rebuild_terrain_cache(self):
+        """Refresh the tile lookup table and drop all cached terrain chunks."""
+        default_tile = self.tiles.get("grass")
+        self._tile_by_id = [self.tiles.get(name) or default_tile for name in TERRAIN_TYPES]
+        self._run_strips.clear()
+        self._chunks.clear()
+        self._dirty = True
+
+    def _get_run_strip(self, terrain_id, length):
+        """Get a surface with `length` copies of a terrain tile side by side."""
+        strip = self._run_strips.get((terrain_id, length))
+        if strip is None:
+            tile_size = self.tile_size
+            tile_img = self._tile_by_id[terrain_id]
+            strip = pygame.Surface((length * tile_size, tile_size))
+            if pygame.display.get_surface() is not None:
+                strip = strip.convert()
+            strip.blits([(tile_img, (i * tile_size, 0)) for i in range(length)], doreturn=0)
+            self._run_strips[(terrain_id, length)] = strip
+        return strip
+
+    def _get_chunk(self, cx, cy):
+        """Get the pre-composited surface for a terrain chunk, painting it if needed."""
+        chunk = self._chunks.get((cx, cy))
+        if chunk is not None:
+            self._chunks.move_to_end((cx, cy))
+            return chunk
+
+        tile_size = self.tile_size
+        get_run_strip = self._get_run_strip
+        x0, y0 = cx * CHUNK_SIZE, cy * CHUNK_SIZE
+        x1 = min(x0 + CHUNK_SIZE, self.width)
+        y1 = min(y0 + CHUNK_SIZE, self.height)
+
+        chunk = pygame.Surface(((x1 - x0) * tile_size, (y1 - y0) * tile_size))
+        if pygame.display.get_surface() is not None:
+            chunk = chunk.convert()
+
+        # Paint each horizontal run of identical terrain with a single blit
+        run_ids, run_lengths, positions = _enumerate_runs(
+            self.terrain_map, x0, y0, x1, y1,
+            tile_size, x0 * tile_size, y0 * tile_size
+        )
+
+        tile_by_id = self._tile_by_id
+        terrain_blits = [
+            (tile_by_id[terrain_id] if length == 1 else get_run_strip(terrain_id, length), tuple(pos))
+            for terrain_id, length, pos in zip(run_ids.tolist(), run_lengths.tolist(), positions.tolist())
+            if tile_by_id[terrain_id] is not None
+        ]
+        chunk.blits(terrain_blits, doreturn=0)
+
+        self._chunks[(cx, cy)] = chunk
+        if len(self._chunks) > MAX_CACHED_CHUNKS:
+            self._chunks.popitem(last=False)
+
+        return chunk
+
+    def set_tile(self, x, y, tile_type):
+        """Change the terrain at a tile (by name) and update its cached chunk."""
+        terrain_id = TERRAIN_IDS[tile_type]
+        self.terrain_map[y, x] = terrain_id
+        self._dirty = True
+
+        chunk = self._chunks.get((x // CHUNK_SIZE, y // CHUNK_SIZE))
+        if chunk is not None:
+            tile_size = self.tile_size
+            tile_rect = ((x % CHUNK_SIZE) * tile_size, (y % CHUNK_SIZE) * tile_size, tile_size, tile_size)
+            chunk.fill((0, 0, 0), tile_rect)
+            tile_img = self._tile_by_id[terrain_id]
+            if tile_img is not None:
+                chunk.blit(tile_img, tile_rect)
+
     def generate_simple_world(self):
         """Generate a simple procedural world for testing."""
-        import random
-
-        # Create some variety in terrain
-        for y in range(self.height):
-            for x in range(self.width):
-                # Desert in the right side
-                if x > self.width * 0.7:
-                    self.terrain_map[y][x] = "desert_sand"
-                # Water patches
-                elif random.random() < 0.05:
-                    self.terrain_map[y][x] = "water_shallow"
-                # Stone paths
-                elif random.random() < 0.03:
-                    self.terrain_map[y][x] = "stone_path"
-                # Grass variants
-                elif random.random() < 0.2:
-                    self.terrain_map[y][x] = "grass_flowers"
-                else:
-                    self.terrain_map[y][x] = "grass"
+        shape = (self.height, self.width)
+
+        # Create some variety in terrain: water patches, stone paths and grass
+        # variants, each rolled in turn on the tiles not yet assigned
+        rolls = [("water_shallow", 0.05), ("stone_path", 0.03), ("grass_flowers", 0.2)]
+
+        # Fold the chained rolls into cumulative thresholds for a single draw
+        thresholds = []
+        cumulative, remaining = 0.0, 1.0
+        for _, chance in rolls:
+            cumulative += remaining * chance
+            remaining *= 1.0 - chance
+            thresholds.append(cumulative)
+        categories = np.array([TERRAIN_IDS[name] for name, _ in rolls] + [TERRAIN_IDS["grass"]], dtype=np.uint8)
+
+        terrain = categories[np.searchsorted(thresholds, np.random.random(shape), side="right")]
+        # Desert in the right side
+        terrain[:, np.arange(self.width) > self.width * 0.7] = TERRAIN_IDS["desert_sand"]
+        self.terrain_map = terrain
 
         # Add some objects
-        for _ in range(100):
-            x = random.randint(0, self.width - 1)
-            y = random.randint(0, self.height - 1)
-            obj_type = random.choice(["tree_oak", "tree_pine", "rock_large", "bush_green"])
-            self.objects.append((x, y, obj_type))
-
+        object_types = ["tree_oak", "tree_pine", "rock_large", "bush_green"]
+        xs = np.random.randint(0, self.width, 100).tolist()
+        ys = np.random.randint(0, self.height, 100).tolist()
+        types = np.random.randint(0, len(object_types), 100).tolist()
+        for x, y, t in zip(xs, ys, types):
+            self.add_object(x, y, object_types[t])
+
+        self._rebuild_terrain_cache()
         logger.info("Generated procedural world")
 
+    def add_object(self, x, y, obj_type):
+        """Place an object on the map."""
+        self.objects.append((x, y, obj_type))
+        self._obj_xy = None
+        self._dirty = True
+
+    def _rebuild_object_arrays(self):
+        """Rebuild the object position/type arrays from self.objects."""
+        # Types without a sprite get an id past the end of OBJECT_TYPES
+        unknown_id = len(OBJECT_TYPES)
+        self._obj_xy = np.array([(x, y) for x, y, _ in self.objects], dtype=np.int32).reshape(-1, 2)
+        self._obj_types = np.array(
+            [OBJECT_IDS.get(obj_type, unknown_id) for _, _, obj_type in self.objects],
+            dtype=np.uint8
+        )
+
     def render(self, screen, screen_width, screen_height):
         """
         Render the visible portion of the map.
@@ -142,40 +385,155 @@ class WorldMap:
             screen_width: Width of the screen
             screen_height: Height of the screen
         """
-        # Calculate visible tile range
-        start_x = max(0, int(self.camera_x // self.tile_size))
-        start_y = max(0, int(self.camera_y // self.tile_size))
-        end_x = min(self.width, int((self.camera_x + screen_width) // self.tile_size) + 2)
-        end_y = min(self.height, int((self.camera_y + screen_height) // self.tile_size) + 2)
+        cam_x = int(self.camera_x)
+        cam_y = int(self.camera_y)
+        frame = self._last_frame
+
+        if frame is None or self._dirty or frame.get_size() != (screen_width, screen_height):
+            # Full redraw
+            if frame is None or frame.get_size() != (screen_width, screen_height):
+                frame = pygame.Surface((screen_width, screen_height))
+                if pygame.display.get_surface() is not None:
+                    frame = frame.convert()
+                self._last_frame = frame
+            frame.fill((0, 0, 0))
+            self._draw_view(frame, cam_x, cam_y, screen_width, screen_height)
+        else:
+            dx = cam_x - self._last_camera[0]
+            dy = cam_y - self._last_camera[1]
+
+            if abs(dx) >= screen_width or abs(dy) >= screen_height:
+                frame.fill((0, 0, 0))
+                self._draw_view(frame, cam_x, cam_y, screen_width, screen_height)
+            elif dx or dy:
+                # Shift the old frame and only redraw the strips scrolled into view
+                frame.scroll(-dx, -dy)
+                strips = []
+                if dx > 0:
+                    strips.append(pygame.Rect(screen_width - dx, 0, dx, screen_height))
+                elif dx < 0:
+                    strips.append(pygame.Rect(0, 0, -dx, screen_height))
+                if dy > 0:
+                    strips.append(pygame.Rect(0, screen_height - dy, screen_width, dy))
+                elif dy < 0:
+                    strips.append(pygame.Rect(0, 0, screen_width, -dy))
+
+                for strip in strips:
+                    frame.set_clip(strip)
+                    frame.fill((0, 0, 0))
+                    self._draw_view(frame, cam_x, cam_y, screen_width, screen_height)
+                frame.set_clip(None)
+
+        screen.blit(frame, (0, 0))
+        self._last_camera = (cam_x, cam_y)
+        self._dirty = False
+
+    def _draw_view(self, surface, cam_x, cam_y, screen_width, screen_height):
+        """Draw the terrain and objects visible from a camera position onto a surface."""
+        tile_size = self.tile_size
+        view = self._view_bounds(cam_x, cam_y, screen_width, screen_height)
+        start_x, start_y, end_x, end_y = view.start_x, view.start_y, view.end_x, view.end_y
+
+        visible_chunks = [
+            (cx, cy)
+            for cy in range(start_y // CHUNK_SIZE, (end_y - 1) // CHUNK_SIZE + 1)
+            for cx in range(start_x // CHUNK_SIZE, (end_x - 1) // CHUNK_SIZE + 1)
+        ]
+
+        # Render terrain as one blit per visible pre-composited chunk
+        chunk_px = CHUNK_SIZE * tile_size
+        get_chunk = self._get_chunk
+        chunk_blits = [
+            (get_chunk(cx, cy), (cx * chunk_px - cam_x, cy * chunk_px - cam_y))
+            for cx, cy in visible_chunks
+        ]
+        surface.blits(chunk_blits, doreturn=0)
+
+        # Render objects grouped by type, in OBJECT_TYPES order
+        images = [self.object_images.get(obj_type) for obj_type in OBJECT_TYPES] + [None]
+        type_ids, obj_xs, obj_ys = self._visible_objects(start_x, start_y, end_x, end_y)
+
+        # Drop objects without a sprite, then compute all screen positions at once
+        # (objects are offset up a tile since they are taller than one tile)
+        has_image = np.array([img is not None for img in images])[type_ids]
+        type_ids = type_ids[has_image].tolist()
+        screen_xs = (obj_xs[has_image] * tile_size - cam_x).tolist()
+        screen_ys = (obj_ys[has_image] * tile_size - cam_y - tile_size).tolist()
+
+        # zip/map build the blit list without running Python bytecode per object
+        surface.blits(list(zip(map(images.__getitem__, type_ids), zip(screen_xs, screen_ys))), doreturn=0)
+
+    def render_gpu(self, renderer, screen_width, screen_height):
+        """
+        Render the visible portion of the map with GPU textures.
+        Requires load_assets to have been called with the same renderer.
+
+        Args:
+            renderer: pygame._sdl2.video.Renderer to draw with
+            screen_width: Width of the screen
+            screen_height: Height of the screen
+        """
+        if not self._use_gpu:
+            logger.warning("render_gpu called before textures were created")
+            return
+
+        tile_size = self.tile_size
+        view = self._view_bounds(int(self.camera_x), int(self.camera_y), screen_width, screen_height)
+        cam_x, cam_y = view.cam_x, view.cam_y
+        start_x, start_y, end_x, end_y = view.start_x, view.start_y, view.end_x, view.end_y
+        object_textures = self._object_textures
+
+        sx_arr = (np.arange(start_x, end_x) * tile_size - cam_x).tolist()
+        sy_arr = (np.arange(start_y, end_y) * tile_size - cam_y).tolist()
 
         # Render terrain tiles
-        for y in range(start_y, end_y):
-            for x in range(start_x, end_x):
-                tile_type = self.terrain_map[y][x]
-
-                # Get tile image or use placeholder
-                if tile_type in self.tiles:
-                    tile_img = self.tiles[tile_type]
-                elif "grass" in self.tiles:
-                    tile_img = self.tiles["grass"]
-                else:
-                    continue
-
-                # Calculate screen position
-                screen_x = x * self.tile_size - self.camera_x
-                screen_y = y * self.tile_size - self.camera_y
-
-                screen.blit(tile_img, (screen_x, screen_y))
-
-        # Render objects
-        for obj_x, obj_y, obj_type in self.objects:
-            # Check if object is in visible range
-            if start_x <= obj_x < end_x and start_y <= obj_y < end_y:
-                if obj_type in self.object_images:
-                    obj_img = self.object_images[obj_type]
-                    screen_x = obj_x * self.tile_size - self.camera_x
-                    screen_y = obj_y * self.tile_size - self.camera_y - self.tile_size  # Offset for taller objects
-                    screen.blit(obj_img, (screen_x, screen_y))
+        tile_textures = self._tile_textures
+        visible_ids = self.terrain_map[start_y:end_y, start_x:end_x].tolist()
+        for screen_y, row in zip(sy_arr, visible_ids):
+            for screen_x, terrain_id in zip(sx_arr, row):
+                texture = tile_textures[terrain_id]
+                if texture is not None:
+                    texture.draw(dstrect=(screen_x, screen_y, tile_size, tile_size))
+
+        # Render objects (offset up a tile since they are taller than one tile)
+        obj_size = tile_size * 2
+        type_ids, obj_xs, obj_ys = self._visible_objects(start_x, start_y, end_x, end_y)
+        for type_id, obj_x, obj_y in zip(type_ids.tolist(), obj_xs.tolist(), obj_ys.tolist()):
+            texture = object_textures[type_id]
+            if texture is not None:
+                # Anchors may sit just outside the tile range, so position from the camera
+                texture.draw(dstrect=(obj_x * tile_size - cam_x, (obj_y - 1) * tile_size - cam_y,
+                                      obj_size, obj_size))
+
+    def _view_bounds(self, cam_x, cam_y, screen_width, screen_height):
+        """Get the ViewBounds (camera and visible tile range) for a camera position."""
+        tile_size = self.tile_size
+        return ViewBounds(
+            cam_x, cam_y,
+            max(0, cam_x // tile_size),
+            max(0, cam_y // tile_size),
+            min(self.width, (cam_x + screen_width) // tile_size + 2),
+            min(self.height, (cam_y + screen_height) // tile_size + 2),
+        )
+
+    def _visible_objects(self, start_x, start_y, end_x, end_y):
+        """
+        Get the type ids, x and y tile positions (as arrays) of every object
+        whose sprite overlaps a tile range, grouped by type in OBJECT_TYPES order.
+        """
+        if self._obj_xy is None:
+            self._rebuild_object_arrays()
+
+        # Sprites are 2x2 tiles drawn one tile up from their anchor, so they reach
+        # one tile left of and below the range. One vectorized test finds them all.
+        obj_xs = self._obj_xy[:, 0]
+        obj_ys = self._obj_xy[:, 1]
+        visible = np.flatnonzero(
+            (obj_xs >= start_x - 1) & (obj_xs < end_x) & (obj_ys >= start_y) & (obj_ys < end_y + 1)
+        )
+        visible = visible[np.argsort(self._obj_types[visible], kind="stable")]
+
+        return self._obj_types[visible], obj_xs[visible], obj_ys[visible]
 
     def move_camera(self, dx, dy):
         """Move the camera by delta amounts."""
@@ -190,27 +548,72 @@ class WorldMap:
         self.camera_y = max(0, min(self.camera_y, max(0, max_y)))
 
     def save_map(self, filename):
-        """Save the map to a JSON file."""
-        data = {
-            "width": self.width,
-            "height": self.height,
-            "terrain": self.terrain_map,
-            "objects": self.objects
-        }
+        """
+        Save the map as a compressed NumPy archive (.npz).
 
-        with open(filename, 'w') as f:
-            json.dump(data, f)
+        Terrain is stored as the uint8 id array and objects as an (N, 3) int32
+        array of (x, y, type index), each with its name table alongside.
+        """
+        object_types = sorted({obj_type for _, _, obj_type in self.objects})
+        type_index = {name: i for i, name in enumerate(object_types)}
+        objects = np.array(
+            [(x, y, type_index[obj_type]) for x, y, obj_type in self.objects],
+            dtype=np.int32
+        ).reshape(-1, 3)
+
+        # Write through a file handle so NumPy doesn't append ".npz" to the name
+        with open(filename, 'wb') as f:
+            np.savez_compressed(
+                f,
+                terrain=self.terrain_map,
+                terrain_types=np.array(TERRAIN_TYPES),
+                objects=objects,
+                object_types=np.array(object_types, dtype=str)
+            )
 
         logger.info(f"Map saved to {filename}")
 
     def load_map(self, filename):
-        """Load a map from a JSON file."""
+        """Load a map saved by save_map (or a legacy JSON map)."""
+        # save_map writes a zip archive whatever the file is called; anything else is legacy JSON
+        with open(filename, 'rb') as f:
+            is_npz = f.read(4) == b"PK\x03\x04"
+
+        if not is_npz:
+            self._load_json_map(filename)
+        else:
+            with np.load(filename) as data:
+                # Remap stored ids through the saved name table so maps survive
+                # changes to TERRAIN_TYPES
+                grass_id = TERRAIN_IDS["grass"]
+                remap = np.array(
+                    [TERRAIN_IDS.get(name, grass_id) for name in data["terrain_types"].tolist()],
+                    dtype=np.uint8
+                )
+                self.terrain_map = remap[data["terrain"]]
+                object_types = data["object_types"].tolist()
+                self.objects = [
+                    (x, y, object_types[type_id])
+                    for x, y, type_id in data["objects"].tolist()
+                ]
+
+            self.height, self.width = self.terrain_map.shape
+
+        self._obj_xy = None
+        self._rebuild_terrain_cache()
+
+        logger.info(f"Map loaded from {filename}")
+
+    def _load_json_map(self, filename):
+        """Load a map from the older JSON format."""
         with open(filename, 'r') as f:
             data = json.load(f)
 
         self.width = data["width"]
         self.height = data["height"]
-        self.terrain_map = data["terrain"]
+        grass_id = TERRAIN_IDS["grass"]
+        self.terrain_map = np.array(
+            [[TERRAIN_IDS.get(name, grass_id) for name in row] for row in data["terrain"]],
+            dtype=np.uint8
+        ).reshape(self.height, self.width)
         self.objects = [tuple(obj) for obj in data["objects"]]
-
-        logger.info(f"Map loaded from {filename}")
@@ -0,0 +1,43 @@
+"""
+Tests for the opt-in precomputed region detail field.
+"""
+
+import numpy as np
+
+from src.world.world_generator_advanced import TieredWorldGenerator
+
+
+def test_detail_field_matches_per_region_sampling():
+    generator = TieredWorldGenerator(seed=42)
+    generator.precompute_detail_field(3, 2, region_width=8, region_height=6)
+
+    assert generator._detail_field.shape == (2 * 6, 3 * 8)
+    assert generator._detail_field.dtype == np.float32
+
+    # Any region's window of the field equals sampling that region on its own
+    window = generator._detail_field[6:12, 16:24]
+    sampled = generator._sample_detail_noise(16, 6, 8, 6)
+    np.testing.assert_allclose(window, sampled, rtol=1e-6, atol=1e-6)
+
+
+def test_region_elevation_unchanged_by_detail_field():
+    # Region of world tile (2, 1) in a 3x2 world of 8x6 regions
+    plain = TieredWorldGenerator(seed=7)
+    expected = plain._generate_constrained_elevation(16, 6, 8, 6, 0.5, None)
+
+    precomputed = TieredWorldGenerator(seed=7)
+    precomputed.precompute_detail_field(3, 2, region_width=8, region_height=6)
+    actual = precomputed._generate_constrained_elevation(16, 6, 8, 6, 0.5, None)
+
+    np.testing.assert_allclose(actual, expected, rtol=1e-6, atol=1e-6)
+
+
+def test_region_outside_detail_field_falls_back_to_sampling():
+    generator = TieredWorldGenerator(seed=7)
+    generator.precompute_detail_field(1, 1, region_width=8, region_height=6)
+
+    # World tile (2, 1) lies beyond the 1x1 field, so it must be sampled directly
+    elevation = generator._generate_constrained_elevation(16, 6, 8, 6, 0.5, None)
+    expected = np.clip(0.5 * 0.7 + generator._sample_detail_noise(16, 6, 8, 6), 0, 1)
+
+    np.testing.assert_allclose(elevation, expected, rtol=1e-6, atol=1e-6)
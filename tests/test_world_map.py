@@ -0,0 +1,62 @@
+"""
+Tests for WorldMap rendering.
+"""
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+import pytest
+
+from src.world.world_map import WorldMap, TERRAIN_IDS, OBJECT_TYPES
+
+
+SCREEN_SIZE = (1280, 720)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def display():
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    yield
+    pygame.display.quit()
+
+
+def _make_map():
+    world = WorldMap(width=80, height=50, tile_size=32)
+    world._generate_placeholder_tiles()
+    world.terrain_map[::7, :] = TERRAIN_IDS["dirt"]
+    world.terrain_map[:, ::5] = TERRAIN_IDS["water_shallow"]
+
+    # Solid 2x2-tile sprites, one color per object type
+    for i, obj_type in enumerate(OBJECT_TYPES):
+        sprite = pygame.Surface((64, 64))
+        sprite.fill((40 + i * 25, 200 - i * 20, 90 + i * 15))
+        world.object_images[obj_type] = sprite
+    for y in range(0, world.height, 3):
+        for x in range(y % 2, world.width, 2):
+            world.add_object(x, y, OBJECT_TYPES[(x + y) % len(OBJECT_TYPES)])
+
+    world._rebuild_terrain_cache()
+    return world
+
+
+def _render(world, camera):
+    world.camera_x, world.camera_y = camera
+    screen = pygame.Surface(SCREEN_SIZE)
+    world.render(screen, *SCREEN_SIZE)
+    return pygame.image.tobytes(screen, "RGB")
+
+
+@pytest.mark.parametrize("start, end", [
+    ((5, 3), (40, 0)),
+    ((0, 0), (1000, 0)),
+    ((300, 200), (283, 171)),
+    ((64, 96), (70, 130)),
+])
+def test_scrolled_render_matches_full_render(start, end):
+    scrolled = _make_map()
+    _render(scrolled, start)
+
+    assert _render(scrolled, end) == _render(_make_map(), end)
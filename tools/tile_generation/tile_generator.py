@@ -3,11 +3,31 @@ AI-powered tile and asset generator for My Kingdom.
 Generates terrain tiles, objects, and props using AI image generation.
 """
 
+import hashlib
+import io
+import os
 import requests
+import shutil
 import urllib.parse
 from pathlib import Path
 from PIL import Image
-import io
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+# Tiles generated at once; each one is mostly waiting on the server
+MAX_WORKERS = 8
+
+# Shared session, backing off on rate limits and transient server errors
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    max_retries=Retry(total=5, backoff_factor=1, status_forcelist=[429, 502, 503, 504]),
+    pool_maxsize=MAX_WORKERS,
+))
+
+# Downloaded tiles keyed by a hash of the request URL; set AI_CACHE_DISABLE=1 to always fetch
+CACHE_DIR = Path(__file__).parent.parent.parent / ".cache" / "tiles"
 
 
 class TileGenerator:
@@ -30,15 +50,26 @@ class TileGenerator:
         try:
             encoded_prompt = urllib.parse.quote(prompt)
             url = f"https://image.pollinations.ai/prompt/{encoded_prompt}?width={size}&height={size}&nologo=true&enhance=true&seed=42"
+            output_path = self.assets_dir / f"{tile_type}.png"
 
-            response = requests.get(url, timeout=60)
-            response.raise_for_status()
+            # The seed is fixed, so the same URL always yields the same tile
+            use_cache = os.environ.get("AI_CACHE_DISABLE") != "1"
+            cache_path = CACHE_DIR / f"{hashlib.sha1(url.encode()).hexdigest()}.png"
+            if use_cache and cache_path.exists():
+                shutil.copyfile(cache_path, output_path)
+                print(f"SUCCESS: Copied cached tile to {output_path}")
+                return output_path
 
+            response = _SESSION.get(url, timeout=60)
+            response.raise_for_status()
             img = Image.open(io.BytesIO(response.content))
+            img.load()
 
             # Save the tile
-            output_path = self.assets_dir / f"{tile_type}.png"
             img.save(output_path)
+            if use_cache:
+                CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                shutil.copyfile(output_path, cache_path)
             print(f"SUCCESS: Saved to {output_path}")
 
             return output_path
@@ -46,6 +77,11 @@ class TileGenerator:
             print(f"ERROR generating {tile_type}: {e}")
             return None
 
+    def generate_tiles(self, tiles, **kwargs):
+        """Generate a mapping of tile name to description concurrently."""
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            return list(executor.map(lambda item: self.generate_tile(*item, **kwargs), tiles.items()))
+
     def generate_terrain_tileset(self):
         """Generate all basic terrain tiles."""
         print("\n" + "="*60)
@@ -81,8 +117,7 @@ class TileGenerator:
             "snow": "white snow ground texture, pristine",
         }
 
-        for tile_name, description in terrain_tiles.items():
-            self.generate_tile(tile_name, description, size=32)
+        self.generate_tiles(terrain_tiles, size=32)
 
     def generate_objects(self):
         """Generate objects and props for the world."""
@@ -120,8 +155,7 @@ class TileGenerator:
             "fence_wood": "wooden fence section, brown planks, top-down view",
         }
 
-        for obj_name, description in objects.items():
-            self.generate_tile(obj_name, description, size=64)  # Objects are larger
+        self.generate_tiles(objects, size=64)  # Objects are larger
 
     def generate_transition_tiles(self):
         """Generate tiles that blend between terrain types."""
@@ -138,8 +172,7 @@ class TileGenerator:
             "sand_to_water_n": "top half sand beach, bottom half water, smooth transition",
         }
 
-        for tile_name, description in transitions.items():
-            self.generate_tile(tile_name, description, size=32)
+        self.generate_tiles(transitions, size=32)
 
     def generate_all(self):
         """Generate complete asset pack."""